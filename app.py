@@ -1,35 +1,100 @@
+import csv
+import functools
+import io
+import json
 import logging
-from flask import Flask, render_template, request, jsonify
-import plotly.graph_objects as go
+import os
+import secrets
+from flask import Flask, Response, render_template, request, jsonify
 import numpy as np
 import math
-from data.solvents import SOLVENTS
-from data.solutes import SOLUTES
+from store import SOLVENT_STORE, SOLUTE_STORE, JSONPayload
+import engine
+import fitting
+import blends
+import spatial
+import red_cache
+import plotting
+import search
+import heavy
+import metrics
+import estimation
+import ranking
+import uncertainty
+from lru import LRUCache
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, 
+# Configure logging (SOLUBIX_LOG_LEVEL=DEBUG also logs request bodies)
+logging.basicConfig(level=os.environ.get("SOLUBIX_LOG_LEVEL", "INFO").upper(),
                     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+# Request counters, latency histograms and /metrics (SOLUBIX_METRICS=0 disables)
+metrics.init_app(app)
+metrics.register_cache("figure", lambda: (plotting.figure_cache.hits, plotting.figure_cache.misses))
+metrics.register_cache("custom_red_row", lambda: (red_cache.custom_rows.hits, red_cache.custom_rows.misses))
+
+# Worker processes for the ternary blend search (0 keeps it in-process)
+BLEND_PROCESSES = int(os.environ.get("SOLUBIX_BLEND_PROCESSES", 0))
+
+# Derived state below is built on first use, or up front by warm_up(), so a
+# bare import stays cheap (python serve.py --import-profile reports the cost)
+
+# Database payloads serialized once and served with ETag/gzip
+@functools.cache
+def solvents_payload():
+    return JSONPayload(SOLVENT_STORE.to_dict())
+
+@functools.cache
+def solutes_payload():
+    return JSONPayload(SOLUTE_STORE.to_dict())
+
+# Ranked name search used by the solvent picker on every keystroke
+SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+@functools.cache
+def solvent_search():
+    return search.SearchIndex(SOLVENT_STORE.names)
+
+# Last result set per token, so follow-up requests can send only deltas.
+# Tokens are per process; clients re-send the full request on a 404.
+SESSION_SIZE = int(os.environ.get("SOLUBIX_SESSIONS", 1024))
+SESSION_TTL = float(os.environ.get("SOLUBIX_SESSION_TTL", 900))
+sessions = LRUCache(SESSION_SIZE, ttl=SESSION_TTL)
+
+# Upper bound on molecules per /api/estimate_hsp request
+MAX_ESTIMATE_MOLECULES = 100_000
+
+# Spatial index over the solvent database for within-sphere and nearest queries
+@functools.cache
+def solvent_grid():
+    return spatial.GridIndex(engine.SOLVENT_MATRIX)
 
 # API Endpoints --------------------------------------------------------------
 @app.route('/api/SOLVENTS')
 def get_solvents():
     """Return JSON data of all available solvents"""
-    return jsonify(SOLVENTS)
+    return payload_response(solvents_payload())
 
 @app.route('/api/SOLUTES')
 def get_solutes():
     """Return JSON data of all available solutes"""
-    return jsonify(SOLUTES)
+    return payload_response(solutes_payload())
 
 @app.route("/api/search_solvents", methods=["GET"])
 def search_solvents():
     """Search solvents by name"""
-    query = request.args.get("q", "").lower()
+    query = request.args.get("q", "")
     logger.debug("Search solvents query: '%s'", query)
-    results = [{"name": name} for name in SOLVENTS if query in name.lower()]
+    try:
+        limit = int(request.args.get("limit", SEARCH_LIMIT))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    if limit < 1:
+        return jsonify({"error": "limit must be at least 1"}), 400
+    limit = min(limit, MAX_SEARCH_LIMIT)
+    results = [{"name": name} for name in solvent_search().search(query, limit)]
     return jsonify(results)
 
 @app.route("/api/calculate", methods=["POST"])
@@ -56,169 +121,833 @@ def calculate():
         if not selected_solvents:
             return jsonify({"error": "No solvents selected"}), 400
 
-        # Get temperature parameter
-        temperature = float(data.get('temperature', 25.0))
-
-        # Process calculations
-        results = {}
-        plot_data = {"solvents": [], "d_values": [], "p_values": [], "h_values": [], "colors": []}
-        temp_data = {"temperatures": np.linspace(0, 100, 101).tolist(), "solubilities": {}}
+        # Get temperature parameter and the curve grid
+        try:
+            temperature = float(data.get('temperature', 25.0))
+            temperatures = get_temperature_grid_from_request(data)
+            plot_format = get_plot_format_from_request(data)
+            mc_params = get_uncertainty_from_request(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        for solvent_name in selected_solvents:
-            solvent = SOLVENTS.get(solvent_name)
-            if not solvent:
+        # Process calculations in one vectorized pass over the solvent matrix
+        with metrics.stage("evaluate"):
+            indices, missing = engine.lookup_solvents(selected_solvents)
+            for solvent_name in missing:
                 logger.warning("Solvent %s not found", solvent_name)
-                continue
-
-            # Calculate base solubility parameters
-            ra = calculate_distance(solute, solvent)
-            red = ra / solute["ro"]
-            solubility, color = get_solubility_status(red)
-            
-            # Apply temperature correction
-            base_solubility = 1/red  # Inverse relationship between RED and solubility
-            temp_corrected_solubility = base_solubility * (1 + 0.02 * (temperature - 25))
-            
-            # Store results
-            results[solvent_name] = {
-                "d": solvent["d"],
-                "p": solvent["p"],
-                "h": solvent["h"],
-                "ra": round(ra, 2),
-                "red": round(red, 2),
-                "solubility": solubility,
-                "temp_corrected_solubility": round(temp_corrected_solubility, 4)
+
+            red = red_cache.red_values(solute, indices, data.get("solute_name"))
+            calc = engine.evaluate(solute, indices, temperature, temperatures, red=red)
+
+        with metrics.stage("format"):
+            names = [engine.SOLVENT_NAMES[i] for i in indices]
+            results = result_rows(names, calc)
+            curves = dict(zip(names, solubility_values(calc["curves"])))
+            temp_data = {
+                "temperatures": temperatures.tolist(),
+                "solubilities": curves
             }
 
-            # Store temperature-dependent values
-            temp_data["solubilities"][solvent_name] = [
-                base_solubility * (1 + 0.02 * (t - 25)) 
-                for t in temp_data["temperatures"]
-            ]
-
-            # Collect plot data
-            plot_data["solvents"].append(solvent_name)
-            plot_data["d_values"].append(solvent["d"])
-            plot_data["p_values"].append(solvent["p"])
-            plot_data["h_values"].append(solvent["h"])
-            plot_data["colors"].append(color)
-
-        # Generate 3D plot
-        plot_json = create_3d_plot(plot_data, solute)
-        
-        return jsonify({
-            "results": results, 
-            "plot_json": plot_json,
-            "temp_data": temp_data
+        if mc_params:
+            with metrics.stage("uncertainty"):
+                add_uncertainty(results, names, solute, indices, mc_params)
+
+        # Generate 3D plot: full figure JSON, or compact arrays the browser renders
+        with metrics.stage("plot"):
+            plot_key = "plot_data" if plot_format == "compact" else "plot_json"
+            plot = get_plot(solute, indices, calc["codes"], plot_format)
+
+        token = save_session({
+            "solute": solute,
+            "solute_name": data.get("solute_name"),
+            "indices": np.array(list(dict.fromkeys(indices.tolist())), dtype=np.int32),
+            "temperature": temperature,
+            "temperatures": temperatures,
+            "plot_format": plot_format,
+            "uncertainty": mc_params,
         })
 
+        response = {
+            "results": results,
+            plot_key: plot,
+            "temp_data": temp_data,
+            "token": token
+        }
+        if mc_params:
+            response["uncertainty"] = mc_params
+        with metrics.stage("serialize"):
+            return jsonify(response)
+
+    except heavy.Busy as e:
+        return busy_response(e)
     except Exception as e:
         logger.error("Error in calculate: %s", str(e))
         return jsonify({"error": f"Calculation failed: {str(e)}"}), 500
 
-# Helper Functions -----------------------------------------------------------
-def calculate_distance(solute, solvent):
-    """Calculate Hansen solubility distance (Ra)"""
+@app.route("/api/calculate_update", methods=["POST"])
+def calculate_update():
+    """Apply solvent/temperature deltas to a previous /api/calculate result
+
+    The session holds only the solute, its solvent rows and settings. Added
+    rows are computed in full; on a temperature change kept rows get just
+    their new temperature-corrected column. The response also carries removed
+    names, curves for added solvents and the solvent points for the plot.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        session = sessions.get(data.get("token"))
+        if session is None:
+            return jsonify({"error": "Unknown or expired token, send the full request"}), 404
+
+        try:
+            add = data.get("add_solvents") or []
+            remove = set(data.get("remove_solvents") or [])
+            temperature = float(data.get("temperature", session["temperature"]))
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": f"Invalid update: {str(e)}"}), 400
+
+        solute, temperatures = session["solute"], session["temperatures"]
+        kept, removed = [], []
+        for i in session["indices"].tolist():
+            (removed if engine.SOLVENT_NAMES[i] in remove else kept).append(i)
+        removed = [engine.SOLVENT_NAMES[i] for i in removed]
+
+        changed = {}
+        if temperature != session["temperature"] and kept:
+            # Ra, RED and the curves do not depend on the selected temperature
+            with metrics.stage("evaluate"):
+                with np.errstate(divide="ignore"):
+                    corrected = 1 / engine.red_vs_temperature(solute, np.array(kept),
+                                                              np.array([temperature]))[:, 0]
+            for i, value in zip(kept, solubility_values(corrected, 4)):
+                changed[engine.SOLVENT_NAMES[i]] = {"temp_corrected_solubility": value}
+
+        present = {engine.SOLVENT_NAMES[i] for i in kept}
+        indices, missing = engine.lookup_solvents([name for name in dict.fromkeys(add)
+                                                   if name not in present])
+        for solvent_name in missing:
+            logger.warning("Solvent %s not found", solvent_name)
+        added = [engine.SOLVENT_NAMES[i] for i in indices]
+        curves = {}
+        if added:
+            with metrics.stage("evaluate"):
+                red = red_cache.red_values(solute, indices, session["solute_name"])
+                calc = engine.evaluate(solute, indices, temperature, temperatures, red=red)
+            rows = result_rows(added, calc)
+            if session["uncertainty"]:
+                with metrics.stage("uncertainty"):
+                    add_uncertainty(rows, added, solute, indices, session["uncertainty"])
+            changed.update(rows)
+            curves = dict(zip(added, solubility_values(calc["curves"])))
+
+        all_indices = np.array(kept + indices.tolist(), dtype=np.int32)
+        if not len(all_indices):
+            return jsonify({"error": "No solvents selected"}), 400
+
+        response = {
+            "results": changed,
+            "removed": removed,
+            "temp_data": {"temperatures": temperatures.tolist(), "solubilities": curves},
+        }
+        if added or removed:
+            # Solute marker and sphere are unchanged; only the solvent points are resent
+            with metrics.stage("plot"):
+                red = red_cache.red_values(solute, all_indices, session["solute_name"])
+                all_codes = engine.status_codes(red)
+                if session["plot_format"] == "compact":
+                    response["plot_update"] = {**plot_points(all_indices, all_codes),
+                                               "status_colors": engine.STATUS_COLORS}
+                else:
+                    response["plot_json"] = get_plot_json(solute, all_indices, all_codes)
+
+        # The client continues from the new token, so the old state is dropped
+        sessions.pop(data["token"])
+        response["token"] = save_session({**session, "temperature": temperature,
+                                          "indices": all_indices})
+        with metrics.stage("serialize"):
+            return jsonify(response)
+
+    except heavy.Busy as e:
+        return busy_response(e)
+    except Exception as e:
+        logger.error("Error in calculate_update: %s", str(e))
+        return jsonify({"error": f"Calculation failed: {str(e)}"}), 500
+
+@app.route("/api/calculate_batch", methods=["POST"])
+def calculate_batch():
+    """Solute × solvent RED matrix for many solutes in one request"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            labels, solutes = get_batch_solutes_from_request(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        # Default to the full database when no solvent subset is given
+        indices, missing = engine.lookup_solvents(data.get("solvents") or engine.SOLVENT_NAMES)
+        for solvent_name in missing:
+            logger.warning("Solvent %s not found", solvent_name)
+        if not len(indices):
+            return jsonify({"error": "No solvents selected"}), 400
+
+        include_plots = bool(data.get("include_plots", False))
+        try:
+            plot_format = get_plot_format_from_request(data) if include_plots else None
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        names = [engine.SOLVENT_NAMES[i] for i in indices]
+        rows = batch_rows(labels, solutes, indices, plot_format)
+
+        if data.get("format") == "ndjson":
+            # Header line with the solvent columns, then one line per solute
+            def generate():
+                header = {"solvents": names, "missing": missing,
+                          "status_labels": engine.STATUS_LABELS}
+                yield json.dumps(header, separators=(",", ":")) + "\n"
+                try:
+                    for row in rows:
+                        yield json.dumps(row, separators=(",", ":")) + "\n"
+                except heavy.Busy as e:
+                    # Headers are already sent, so end the stream with an error line
+                    yield json.dumps({"error": str(e)}) + "\n"
+            return Response(generate(), mimetype="application/x-ndjson")
+
+        # Columnar layout: one list per field, rows aligned with "solutes"
+        result = {"solvents": names, "missing": missing, "status_labels": engine.STATUS_LABELS,
+                  "solutes": [], "ra": [], "red": [], "status": []}
+        if include_plots:
+            result["plots"] = []
+        for row in rows:
+            result["solutes"].append(row["solute"])
+            result["ra"].append(row["ra"])
+            result["red"].append(row["red"])
+            result["status"].append(row["status"])
+            if include_plots:
+                result["plots"].append(row["plot"])
+        return jsonify(result)
+
+    except heavy.Busy as e:
+        return busy_response(e)
+    except Exception as e:
+        logger.error("Error in calculate_batch: %s", str(e))
+        return jsonify({"error": f"Batch calculation failed: {str(e)}"}), 500
+
+@app.route("/api/export", methods=["POST"])
+def export_results():
+    """Stream screening results row by row as NDJSON or CSV"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            if data.get("solutes"):
+                labels, solutes = get_batch_solutes_from_request(data)
+            else:
+                solute = get_solute_from_request(data)
+                if solute["ro"] <= 0:
+                    raise ValueError("Ro must be positive")
+                labels, solutes = [data.get("solute_name") or "solute_0"], [solute]
+            temperature = float(data.get("temperature", 25.0))
+            temperatures = get_temperature_grid_from_request(data)
+            # 0 omits temperature curves, n keeps every n-th point of the grid
+            curve_step = int(data.get("curve_step", 0))
+            if curve_step < 0:
+                raise ValueError("curve_step must not be negative")
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        export_format = data.get("format", "ndjson")
+        if export_format not in ("ndjson", "csv"):
+            return jsonify({"error": f"Unsupported export format: {export_format}"}), 400
+
+        indices, missing = engine.lookup_solvents(data.get("solvents") or engine.SOLVENT_NAMES)
+        for solvent_name in missing:
+            logger.warning("Solvent %s not found", solvent_name)
+        if not len(indices):
+            return jsonify({"error": "No solvents selected"}), 400
+
+        temperatures = temperatures[::curve_step] if curve_step else temperatures[:0]
+        rows = export_rows(labels, solutes, indices, temperature, temperatures)
+        if export_format == "csv":
+            return Response(csv_lines(rows, temperatures.tolist()), mimetype="text/csv",
+                            headers={"Content-Disposition": "attachment; filename=solubix_export.csv"})
+        return Response(ndjson_lines(rows, temperatures.tolist()), mimetype="application/x-ndjson")
+
+    except Exception as e:
+        logger.error("Error in export_results: %s", str(e))
+        return jsonify({"error": f"Export failed: {str(e)}"}), 500
+
+@app.route("/api/fit_sphere", methods=["POST"])
+def fit_sphere():
+    """Fit solute HSP center and Ro to solvents labelled good/bad"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            points, good = get_fit_points_from_request(data)
+            fit = heavy.run(fitting.fit_sphere, points, good)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify(fit)
+
+    except heavy.Busy as e:
+        return busy_response(e)
+    except Exception as e:
+        logger.error("Error in fit_sphere: %s", str(e))
+        return jsonify({"error": f"Sphere fit failed: {str(e)}"}), 500
+
+@app.route("/api/blends", methods=["POST"])
+def search_blends():
+    """Rank binary/ternary solvent blends by RED to a solute"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            solute = get_solute_from_request(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if solute["ro"] <= 0:
+            return jsonify({"error": "Ro must be positive"}), 400
+
+        # Default to the full database when no solvent subset is given
+        selected_solvents = data.get("solvents") or engine.SOLVENT_NAMES
+        indices, missing = engine.lookup_solvents(selected_solvents)
+        for solvent_name in missing:
+            logger.warning("Solvent %s not found", solvent_name)
+        if len(indices) < 2:
+            return jsonify({"error": "At least two solvents are required"}), 400
+
+        try:
+            result = heavy.run(
+                blends.search_blends, solute, indices,
+                step=float(data.get("step", 0.05)),
+                top_k=int(data.get("top_k", 10)),
+                ternary=bool(data.get("ternary", False)),
+                processes=BLEND_PROCESSES)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify(result)
+
+    except heavy.Busy as e:
+        return busy_response(e)
+    except Exception as e:
+        logger.error("Error in search_blends: %s", str(e))
+        return jsonify({"error": f"Blend search failed: {str(e)}"}), 500
+
+@app.route("/api/rank_solvents", methods=["POST"])
+def rank_solvents():
+    """Pareto front of solvents for extraction: close to the target, far from
+    the solutes to reject and far from the carrier solvent"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            solute = get_solute_from_request(data)
+            if solute["ro"] <= 0:
+                raise ValueError("Ro must be positive")
+            rejects = get_batch_solutes_from_request({"solutes": data["reject"]})[1] \
+                if data.get("reject") else []
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        carrier = data.get("carrier", "Water" if "Water" in SOLVENT_STORE else None)
+        if carrier and carrier not in SOLVENT_STORE:
+            return jsonify({"error": f"Carrier solvent {carrier} not found"}), 400
+
+        # Default to the full database, never offering the carrier itself
+        indices, missing = engine.lookup_solvents(data.get("solvents") or engine.SOLVENT_NAMES)
+        for solvent_name in missing:
+            logger.warning("Solvent %s not found", solvent_name)
+        indices = np.unique(indices)
+        if carrier:
+            indices = indices[indices != engine.SOLVENT_INDEX[carrier]]
+        if not len(indices):
+            return jsonify({"error": "No solvents selected"}), 400
+
+        # One column per criterion, every one minimized
+        red = red_cache.red_values(solute, indices, data.get("solute_name"))
+        columns = {"red": red}
+        objectives = [red]
+        if rejects:
+            centers = [(s["d"], s["p"], s["h"]) for s in rejects]
+            ro = np.array([s["ro"] for s in rejects])
+            reject_red = engine.hsp_distance_matrix(centers, engine.SOLVENT_MATRIX[indices])
+            columns["reject_red"] = (reject_red / ro[:, None]).min(axis=0)
+            objectives.append(-columns["reject_red"])
+        if carrier:
+            columns["carrier_ra"] = ranking.carrier_distances(engine.SOLVENT_INDEX[carrier])[indices]
+            objectives.append(-columns["carrier_ra"])
+
+        front = np.flatnonzero(ranking.pareto_front(np.column_stack(objectives)))
+        front = front[np.argsort(red[front], kind="stable")]
+        codes = engine.status_codes(red[front])
+        rows = [{"name": engine.SOLVENT_NAMES[i], "solubility": engine.STATUS_LABELS[code]}
+                for i, code in zip(indices[front].tolist(), codes.tolist())]
+        for key, values in columns.items():
+            for row, value in zip(rows, np.round(values[front], 2).tolist()):
+                row[key] = value
+
+        return jsonify({"front": rows, "objectives": list(columns),
+                        "carrier": carrier, "candidates": int(len(indices))})
+
+    except Exception as e:
+        logger.error("Error in rank_solvents: %s", str(e))
+        return jsonify({"error": f"Ranking failed: {str(e)}"}), 500
+
+@app.route("/api/estimate_hsp", methods=["POST"])
+def estimate_hsp():
+    """Estimate δD/δP/δH from functional-group counts for one or many molecules"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        try:
+            labels, molecules = get_molecules_from_request(data)
+            estimates = estimation.estimate_batch(molecules)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        d, p, h, volume = np.round(estimates, 2).T.tolist()
+        return jsonify({"molecules": labels, "d": d, "p": p, "h": h, "volume": volume})
+
+    except Exception as e:
+        logger.error("Error in estimate_hsp: %s", str(e))
+        return jsonify({"error": f"Estimation failed: {str(e)}"}), 500
+
+@app.route("/api/solvents_within", methods=["GET"])
+def solvents_within():
+    """List solvents inside a solute's sphere, scaled by red_max"""
+    try:
+        solute = get_solute_from_request(get_query_args())
+        red_max = float(request.args.get("red_max", 1.0))
+        if not math.isfinite(red_max) or red_max < 0:
+            raise ValueError("red_max must be a finite, non-negative number")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if solute["ro"] <= 0:
+        return jsonify({"error": "Ro must be positive"}), 400
+
+    center = (solute["d"], solute["p"], solute["h"])
+    indices, distances = solvent_grid().within(center, red_max * solute["ro"])
+    return jsonify(format_neighbours(indices, distances, solute))
+
+@app.route("/api/nearest_solvents", methods=["GET"])
+def nearest_solvents():
+    """List the k solvents closest to a solute in HSP space"""
     try:
-        return math.sqrt(
-            4 * (solute["d"] - solvent["d"])**2 +
-            (solute["p"] - solvent["p"])**2 +
-            (solute["h"] - solvent["h"])**2
-        )
-    except KeyError as e:
-        raise ValueError(f"Missing HSP parameter: {e}")
+        solute = get_solute_from_request(get_query_args())
+        k = int(request.args.get("k", 10))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    if solute["ro"] <= 0:
+        return jsonify({"error": "Ro must be positive"}), 400
+
+    center = (solute["d"], solute["p"], solute["h"])
+    indices, distances = solvent_grid().nearest(center, k)
+    return jsonify(format_neighbours(indices, distances, solute))
+
+# Helper Functions -----------------------------------------------------------
 def get_solute_from_request(data):
     """Validate and retrieve solute parameters"""
     solute_name = data.get("solute_name")
-    if solute_name and solute_name in SOLUTES:
-        return SOLUTES[solute_name]
+    if solute_name and solute_name in SOLUTE_STORE:
+        return SOLUTE_STORE.row(solute_name)
     
     try:
-        return {
-            "d": float(data["solute_d"]),
-            "p": float(data["solute_p"]),
-            "h": float(data["solute_h"]),
-            "ro": float(data["solute_ro"])
-        }
+        if data.get("solute_groups"):
+            # δD/δP/δH estimated from functional groups; Ro still comes from the request
+            solute = estimation.estimate(data["solute_groups"], data.get("solute_symmetry_planes", 0))
+            del solute["v"]
+        else:
+            solute = {
+                "d": float(data["solute_d"]),
+                "p": float(data["solute_p"]),
+                "h": float(data["solute_h"])
+            }
+        solute["ro"] = float(data["solute_ro"])
+        if data.get("solute_alpha") not in (None, ""):
+            solute["alpha"] = float(data["solute_alpha"])
     except (KeyError, ValueError) as e:
         raise ValueError(f"Invalid solute parameters: {str(e)}")
+    if not all(math.isfinite(v) for v in solute.values()):
+        raise ValueError("Invalid solute parameters: values must be finite numbers")
+    return solute
+
+def get_temperature_grid_from_request(data):
+    """Temperature grid for RED(T) curves from optional temp_min/temp_max/temp_points"""
+    try:
+        return engine.temperature_grid(float(data.get("temp_min", 0.0)),
+                                       float(data.get("temp_max", 100.0)),
+                                       int(data.get("temp_points", 101)))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid temperature grid: {str(e)}")
+
+PLOT_FORMATS = ("figure", "compact")
+
+def get_plot_format_from_request(data):
+    """Plot payload format: "figure" (Plotly JSON string) or "compact" (arrays only)"""
+    plot_format = data.get("plot_format", "figure")
+    if plot_format not in PLOT_FORMATS:
+        raise ValueError(f"plot_format must be one of {', '.join(PLOT_FORMATS)}")
+    return plot_format
+
+def get_batch_solutes_from_request(data):
+    """Validate a list of solutes given by name or custom d/p/h/ro"""
+    entries = data.get("solutes", [])
+    if not entries:
+        raise ValueError("No solutes provided")
+
+    if not isinstance(entries, list):
+        raise ValueError("solutes must be a list of names or objects")
+
+    labels, solutes = [], []
+    for i, entry in enumerate(entries):
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict):
+            raise ValueError(f"Invalid solute {entry}: expected a name or an object with d/p/h/ro")
+        name = entry.get("name")
+        if name is not None and not isinstance(name, str):
+            raise ValueError(f"Invalid solute {entry}: name must be a string")
+        if name in SOLUTE_STORE and not {"d", "p", "h", "ro"} & entry.keys():
+            solute = SOLUTE_STORE.row(name)
+        else:
+            try:
+                if entry.get("groups"):
+                    solute = estimation.estimate(entry["groups"], entry.get("symmetry_planes", 0))
+                    del solute["v"]
+                    solute["ro"] = float(entry["ro"])
+                else:
+                    solute = {k: float(entry[k]) for k in ("d", "p", "h", "ro")}
+                if entry.get("alpha") is not None:
+                    solute["alpha"] = float(entry["alpha"])
+            except KeyError as e:
+                raise ValueError(f"Invalid solute {entry}: missing {e}")
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid solute {entry}: {str(e)}")
+        if not all(math.isfinite(v) for v in solute.values()):
+            raise ValueError(f"Invalid solute {entry}: values must be finite numbers")
+        if solute["ro"] <= 0:
+            raise ValueError(f"Ro must be positive for solute {entry}")
+        labels.append(name or f"solute_{i}")
+        solutes.append(solute)
+    return labels, solutes
+
+def get_molecules_from_request(data):
+    """Molecules for group-contribution estimation, as a list or a single "groups" entry"""
+    entries = data.get("molecules") or ([data] if data.get("groups") else [])
+    if not entries:
+        raise ValueError("No molecules provided")
+    if len(entries) > MAX_ESTIMATE_MOLECULES:
+        raise ValueError(f"At most {MAX_ESTIMATE_MOLECULES} molecules per request")
+    if not all(isinstance(entry, dict) for entry in entries):
+        raise ValueError("Each molecule must be an object with a groups field")
+    labels = [entry.get("name") or f"molecule_{i}" for i, entry in enumerate(entries)]
+    return labels, entries
+
+def batch_rows(labels, solutes, indices, plot_format=None, chunk=256):
+    """Yield one compact row per solute, computing the RED matrix a chunk of solutes at a time"""
+    for start in range(0, len(solutes), chunk):
+        block = solutes[start:start + chunk]
+        centers = [(s["d"], s["p"], s["h"]) for s in block]
+        ro = np.array([s["ro"] for s in block], dtype=np.float64)
+        ra = engine.hsp_distance_matrix(centers, engine.SOLVENT_MATRIX[indices])
+        red = ra / ro[:, None]
+        codes = engine.status_codes(red)
+        for label, solute, ra_row, red_row, code_row in zip(
+                labels[start:start + chunk], block, np.round(ra, 2).tolist(),
+                np.round(red, 2).tolist(), codes):
+            row = {"solute": label, "ra": ra_row, "red": red_row, "status": code_row.tolist()}
+            if plot_format:
+                row["plot"] = get_plot(solute, indices, code_row, plot_format)
+            yield row
+
+EXPORT_COLUMNS = ["solute", "solvent", "d", "p", "h", "ra", "red", "solubility",
+                  "temp_corrected_solubility"]
+
+EXPORT_CHUNK = 4096
+
+def export_rows(labels, solutes, indices, temperature, temperatures, chunk=EXPORT_CHUNK):
+    """Yield one result row per (solute, solvent), evaluating a chunk of solvents at a time"""
+    for label, solute in zip(labels, solutes):
+        for start in range(0, len(indices), chunk):
+            block = indices[start:start + chunk]
+            calc = engine.evaluate(solute, block, temperature, temperatures)
+            for i, (d, p, h), ra, red, code, corrected, curve in zip(
+                    block, calc["points"].tolist(), calc["ra"].tolist(), calc["red"].tolist(),
+                    calc["codes"].tolist(), solubility_values(calc["temp_corrected"], 4),
+                    solubility_values(calc["curves"], 4)):
+                yield {
+                    "solute": label,
+                    "solvent": engine.SOLVENT_NAMES[i],
+                    "d": d,
+                    "p": p,
+                    "h": h,
+                    "ra": round(ra, 2),
+                    "red": round(red, 2),
+                    "solubility": engine.STATUS_LABELS[code],
+                    "temp_corrected_solubility": corrected,
+                    "curve": curve
+                }
 
-def get_solubility_status(red_value):
-    """Determine solubility status from RED value"""
-    if red_value <= 1: return "Soluble", "green"
-    if red_value <= 1.5: return "Partially Soluble", "orange"
-    return "Insoluble", "red"
+def ndjson_lines(rows, temperatures):
+    """Header line with the curve temperatures, then one JSON object per row"""
+    yield json.dumps({"columns": EXPORT_COLUMNS, "temperatures": temperatures},
+                     separators=(",", ":")) + "\n"
+    for row in rows:
+        if not temperatures:
+            del row["curve"]
+        yield json.dumps(row, separators=(",", ":")) + "\n"
+
+def csv_lines(rows, temperatures):
+    """CSV header and rows, with one column per curve temperature"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS + [f"solubility_{t:g}C" for t in temperatures])
+    for row in rows:
+        writer.writerow([row[column] for column in EXPORT_COLUMNS] + row["curve"])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+def busy_response(error):
+    """503 telling the client to retry when the heavy-work pool is saturated"""
+    response = jsonify({"error": str(error)})
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    return response
+
+def payload_response(payload):
+    """Serve a pre-serialized payload, gzip'd when accepted and 304 when unchanged"""
+    # Quality-aware: "gzip;q=0" or "*;q=0" refuse gzip even though they name it
+    use_gzip = request.accept_encodings["gzip"] > 0
+    response = Response(payload.gzip_body if use_gzip else payload.body,
+                        mimetype="application/json")
+    if use_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    response.headers["Vary"] = "Accept-Encoding"
+    # Revalidate on every load; unchanged databases cost a 304 with no body
+    response.cache_control.no_cache = True
+    response.set_etag(payload.etag + ("-gz" if use_gzip else ""))
+    return response.make_conditional(request)
+
+def get_query_args():
+    """Query-string arguments with ?solute= accepted as the solute name"""
+    args = request.args.to_dict()
+    if "solute" in args:
+        args.setdefault("solute_name", args["solute"])
+    return args
+
+def format_neighbours(indices, distances, solute):
+    """Spatial query hits as result rows, nearest first"""
+    red = distances / solute["ro"]
+    return [
+        {
+            "name": engine.SOLVENT_NAMES[i],
+            "ra": round(ra, 2),
+            "red": round(r, 2),
+            "solubility": engine.STATUS_LABELS[code]
+        }
+        for i, ra, r, code in zip(indices.tolist(), distances.tolist(),
+                                  red.tolist(), engine.status_codes(red).tolist())
+    ]
+
+def get_fit_points_from_request(data):
+    """Validate labelled test points given by solvent name or custom d/p/h"""
+    entries = data.get("points", [])
+    if not entries:
+        raise ValueError("No test points provided")
+
+    points, good = [], []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Invalid test point {entry}: expected an object with name or d/p/h and good")
+        name = entry.get("name")
+        try:
+            if name:
+                solvent = SOLVENT_STORE.row(name)
+            else:
+                solvent = {k: float(entry[k]) for k in ("d", "p", "h")}
+            points.append((solvent["d"], solvent["p"], solvent["h"]))
+            good.append(bool(entry["good"]))
+        except KeyError as e:
+            raise ValueError(f"Invalid test point {entry}: missing {e}")
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid test point {entry}: {str(e)}")
+    return points, good
+
+def result_rows(names, calc):
+    """Per-solvent result rows keyed by name, from an engine.evaluate() result"""
+    d_values, p_values, h_values = calc["points"].T.tolist()
+    results = {}
+    for name, d, p, h, ra, red, code, corrected in zip(
+            names, d_values, p_values, h_values, calc["ra"].tolist(),
+            calc["red"].tolist(), calc["codes"].tolist(),
+            solubility_values(calc["temp_corrected"], 4)):
+        results[name] = {
+            "d": d,
+            "p": p,
+            "h": h,
+            "ra": round(ra, 2),
+            "red": round(red, 2),
+            "solubility": engine.STATUS_LABELS[code],
+            "temp_corrected_solubility": corrected
+        }
+    return results
+
+def solubility_values(values, digits=None):
+    """1/RED values as (nested) lists, None where RED is 0 since JSON has no Infinity"""
+    values = np.asarray(values, dtype=np.float64)
+    if digits is not None:
+        values = np.round(values, digits)
+    finite = np.isfinite(values)
+    if finite.all():
+        return values.tolist()
+    values = values.astype(object)
+    values[~finite] = None
+    return values.tolist()
+
+def get_uncertainty_from_request(data):
+    """Monte Carlo settings from an optional "uncertainty" object (or true for defaults)
+
+    sigma / solvent_sigma may be one number for d/p/h or per-component
+    {"d", "p", "h"[, "ro"]}; Ro is only perturbed when sigma gives "ro".
+    The seed is filled in when missing so the response can be reproduced.
+    """
+    options = data.get("uncertainty")
+    if not options:
+        return None
+    if options is True:
+        options = {}
+    if not isinstance(options, dict):
+        raise ValueError("uncertainty must be an object or true")
+
+    def sigmas(value, components, defaults):
+        if not isinstance(value, dict):
+            value = dict.fromkeys(("d", "p", "h"), value)
+        result = {c: float(value.get(c, defaults[c])) for c in components}
+        if any(s < 0 or not math.isfinite(s) for s in result.values()):
+            raise ValueError("Standard deviations must be non-negative")
+        return result
+
+    def integer(value, name):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) \
+                or not math.isfinite(value) or value != int(value):
+            raise ValueError(f"{name} must be an integer")
+        return int(value)
+
+    try:
+        sigma = uncertainty.DEFAULT_SIGMA
+        params = {
+            "samples": integer(options.get("samples", uncertainty.DEFAULT_SAMPLES), "samples"),
+            "sigma": sigmas(options.get("sigma", {}), ("d", "p", "h", "ro"),
+                            {"d": sigma, "p": sigma, "h": sigma, "ro": 0.0}),
+            "solvent_sigma": sigmas(options.get("solvent_sigma", {}), ("d", "p", "h"),
+                                    {"d": sigma, "p": sigma, "h": sigma}),
+            "seed": integer(options["seed"], "seed") if options.get("seed") is not None
+                    else secrets.randbits(32),
+            "confidence": float(options.get("confidence", uncertainty.DEFAULT_CONFIDENCE)),
+        }
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid uncertainty settings: {str(e)}")
+    if not 1 <= params["samples"] <= uncertainty.MAX_SAMPLES:
+        raise ValueError(f"samples must be between 1 and {uncertainty.MAX_SAMPLES}")
+    if params["seed"] < 0:
+        raise ValueError("seed must be a non-negative integer")
+    if not 0 < params["confidence"] < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    return params
+
+def add_uncertainty(results, names, solute, indices, params):
+    """Add Monte Carlo p_soluble, red_median and red_ci to result rows"""
+    mc = heavy.run(uncertainty.monte_carlo_red, solute, indices, **params)
+    for name, p, low, median, high in zip(
+            names, mc["p_soluble"].tolist(), np.round(mc["red_low"], 2).tolist(),
+            np.round(mc["red_median"], 2).tolist(), np.round(mc["red_high"], 2).tolist()):
+        results[name].update({"p_soluble": round(p, 4), "red_median": median,
+                              "red_ci": [low, high]})
+
+def save_session(state):
+    """Store a result set for /api/calculate_update and return its new token"""
+    token = secrets.token_urlsafe(16)
+    sessions.put(token, state)
+    return token
+
+def get_plot(solute, indices, codes, plot_format="figure"):
+    if plot_format == "compact":
+        return get_plot_data(solute, indices, codes)
+    return get_plot_json(solute, indices, codes)
+
+def plot_points(indices, codes):
+    """Plotted solvent points: each row once, in database order, with its status code
+
+    Requests for the same solvent set therefore share one cached figure.
+    """
+    unique, first = np.unique(indices, return_index=True)
+    d_values, p_values, h_values = engine.SOLVENT_MATRIX[unique].T.tolist()
+    return {
+        "solvents": [engine.SOLVENT_NAMES[i] for i in unique.tolist()],
+        "d_values": d_values,
+        "p_values": p_values,
+        "h_values": h_values,
+        "status": codes[first].tolist()
+    }
+
+def get_plot_json(solute, indices, codes):
+    """3D plot JSON for a solute and solvent rows, reused from the figure cache when possible"""
+    plot_key = plotting.cache_key(solute, indices.tolist())
+    plot_json = plotting.figure_cache.get(plot_key)
+    if plot_json is None:
+        plot_data = plot_points(indices, codes)
+        plot_data["colors"] = [engine.STATUS_COLORS[c] for c in plot_data.pop("status")]
+        plot_json = heavy.run(create_3d_plot, plot_data, solute)
+        plotting.figure_cache.put(plot_key, plot_json)
+    return plot_json
+
+def get_plot_data(solute, indices, codes):
+    """Compact plot payload: point arrays, status codes and the sphere, rendered by the browser"""
+    plot_data = plot_points(indices, codes)
+    plot_data["status_colors"] = engine.STATUS_COLORS
+    plot_data["solute"] = {k: solute[k] for k in ("d", "p", "h", "ro")}
+    return plot_data
 
 def create_3d_plot(plot_data, solute=None):
-    """Generate 3D plot using Plotly"""
-    fig = go.Figure()
-
-    # Add solvent points
-    fig.add_trace(go.Scatter3d(
-        x=plot_data["d_values"],
-        y=plot_data["p_values"],
-        z=plot_data["h_values"],
-        mode="markers+text",
-        marker=dict(size=10, color=plot_data["colors"], colorscale="Viridis"),
-        text=plot_data["solvents"],
-        hovertext=[f"{name}: δD={d:.1f}, δP={p:.1f}, δH={h:.1f}"
-                   for name, d, p, h in zip(plot_data["solvents"], 
-                                          plot_data["d_values"],
-                                          plot_data["p_values"],
-                                          plot_data["h_values"])],
-        name="Solvents"
-    ))
-
-    # Add solute visualization if provided
-    if solute:
-        add_solute_to_plot(fig, solute)
-
-    fig.update_layout(
-        scene=dict(
-            xaxis_title="δD (Dispersion)",
-            yaxis_title="δP (Polar)",
-            zaxis_title="δH (Hydrogen Bonding)",
-            aspectmode='cube',
-            camera=dict(eye=dict(x=1.5, y=1.5, z=1.2))
-        ),
-        margin=dict(l=0, r=0, b=0, t=30),
-        height=600
-    )
-    
-    return fig.to_json()
-
-def add_solute_to_plot(fig, solute):
-    """Add solute and solubility sphere to plot"""
-    fig.add_trace(go.Scatter3d(
-        x=[solute["d"]], y=[solute["p"]], z=[solute["h"]],
-        mode="markers+text",
-        marker=dict(size=14, color="blue", symbol="diamond"),
-        text=["Solute"],
-        hovertext=f"Solute: δD={solute['d']:.1f}, δP={solute['p']:.1f}, δH={solute['h']:.1f}",
-        name="Solute"
-    ))
-
-    if "ro" in solute:
-        u, v = np.mgrid[0:2*np.pi:20j, 0:np.pi:10j]
-        x = solute["ro"] * np.cos(u)*np.sin(v) + solute["d"]
-        y = solute["ro"] * np.sin(u)*np.sin(v) + solute["p"]
-        z = solute["ro"] * np.cos(v) + solute["h"]
-        
-        fig.add_trace(go.Surface(
-            x=x, y=y, z=z, opacity=0.2,
-            colorscale=[[0, 'blue'], [1, 'blue']],
-            showscale=False,
-            name="Solubility Sphere"
-        ))
+    """Generate 3D plot JSON (byte-identical to the Plotly figure's to_json())"""
+    with metrics.stage("plot_build"):
+        return plotting.figure_json(plot_data, solute)
 
 # Main Routes -----------------------------------------------------------------
 @app.route("/")
 def index():
     """Serve main application page"""
-    return render_template("index.html", 
-                         solvents=sorted(SOLVENTS.keys()),
-                         solutes=SOLUTES)
+    return render_template("index.html")
+
+def warm_up():
+    """Build lazily created state up front, e.g. before forking server workers"""
+    solvents_payload()
+    solutes_payload()
+    solvent_search()
+    solvent_grid()
+    plotting.reference_parts()
 
 if __name__ == "__main__":
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""Endpoint latency benchmarks using Flask's test client (no network)
+
+    python benchmarks/bench.py                       # bundled DB + 10k/100k synthetic libraries
+    python benchmarks/bench.py --sizes 0             # bundled DB only
+    python benchmarks/bench.py --save baseline.json  # store results
+    python benchmarks/bench.py --compare baseline.json --fail-on-regression
+
+Each library size runs in its own subprocess, because the solvent store is
+loaded at import from SOLUBIX_SOLVENTS_FILE.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZES = [0, 10_000, 100_000]
+REGRESSION_RATIO = 1.25
+
+# Worker side ------------------------------------------------------------------
+def make_library(size, directory):
+    """Synthetic solvent library of the given size, written as .npz"""
+    import numpy as np
+    sys.path.insert(0, ROOT)
+    from store import HSPStore, SOLVENT_COLUMNS
+
+    rng = np.random.default_rng(size)
+    values = rng.uniform([13.0, 0.0, 0.0], [22.0, 25.0, 40.0], (size, 3)).round(1)
+    names = [f"Synthetic solvent {i:06d}" for i in range(size)]
+    path = os.path.join(directory, f"solvents-{size}.npz")
+    HSPStore(names, values, SOLVENT_COLUMNS).save_npz(path)
+    return path
+
+def measure(call, budget, min_runs=5, max_runs=200):
+    """Latencies (s) of repeated calls within a time budget, plus one traced run"""
+    call()  # warm-up, not timed
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_runs or (len(times) < max_runs
+                                    and time.perf_counter() - start < budget):
+        t0 = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - t0)
+
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return times, peak, sys.getallocatedblocks() - blocks_before
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+def run_cases(budget):
+    sys.path.insert(0, ROOT)
+    import app as solubix
+    import plotting
+    import red_cache
+
+    client = solubix.app.test_client()
+    names = solubix.SOLVENT_STORE.names
+    solute = {"solute_d": 18.2, "solute_p": 8.6, "solute_h": 11.5, "solute_ro": 5.5}
+
+    def expect_ok(response):
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.get_data(as_text=True)[:200]}")
+        return response
+
+    def cold_calculate(solvents):
+        # Clear caches so every run exercises the distance, curve and plot code
+        def call():
+            plotting.figure_cache.clear()
+            red_cache.custom_rows.clear()
+            expect_ok(client.post("/api/calculate", json={**solute, "solvents": solvents}))
+        return call
+
+    cases = []
+    for count in sorted({1, 10, len(names)}):
+        if count <= len(names):
+            cases.append((f"calculate[{count}]", count, cold_calculate(names[:count])))
+    cases += [
+        ("calculate_batch[10 solutes]", len(names), lambda: expect_ok(client.post(
+            "/api/calculate_batch",
+            json={"solutes": [{"d": 15 + i, "p": 5, "h": 8, "ro": 5} for i in range(10)]}))),
+        ("search_solvents[prefix]", len(names),
+         lambda: expect_ok(client.get("/api/search_solvents?q=syn"))),
+        ("search_solvents[substring]", len(names),
+         lambda: expect_ok(client.get("/api/search_solvents?q=ethyl"))),
+        ("search_solvents[fuzzy]", len(names),
+         lambda: expect_ok(client.get("/api/search_solvents?q=tolune"))),
+        ("nearest_solvents[k=10]", len(names), lambda: expect_ok(client.get(
+            "/api/nearest_solvents?solute_d=18.2&solute_p=8.6&solute_h=11.5&solute_ro=5.5&k=10"))),
+        ("solvents_within[red<=1]", len(names), lambda: expect_ok(client.get(
+            "/api/solvents_within?solute_d=18.2&solute_p=8.6&solute_h=11.5&solute_ro=5.5"))),
+        ("SOLVENTS", len(names), lambda: expect_ok(client.get("/api/SOLVENTS"))),
+    ]
+
+    results = []
+    for name, count, call in cases:
+        times, peak, blocks = measure(call, budget)
+        results.append({
+            "case": name,
+            "solvents": count,
+            "runs": len(times),
+            "p50_ms": percentile(times, 50) * 1000,
+            "p99_ms": percentile(times, 99) * 1000,
+            "throughput_rps": len(times) / sum(times),
+            "peak_alloc_kb": peak / 1024,
+            "net_blocks": blocks,
+        })
+    return results
+
+# Driver side ------------------------------------------------------------------
+def run_library(size, budget, directory):
+    """Run the cases in a subprocess against the bundled DB (size 0) or a synthetic one"""
+    env = dict(os.environ, SOLUBIX_LOG_LEVEL="WARNING",
+               SOLUBIX_CACHE_DIR=os.path.join(directory, "cache"))
+    if size:
+        env["SOLUBIX_SOLVENTS_FILE"] = make_library(size, directory)
+    output = subprocess.run(
+        [sys.executable, __file__, "--worker", "--budget", str(budget)],
+        env=env, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+def print_table(results, baseline):
+    header = f"{'library':>9} {'case':<30} {'n':>7} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>9} {'peak KB':>9}"
+    if baseline:
+        header += f" {'p50 vs base':>12}"
+    print(header)
+    regressions = []
+    for library, rows in results.items():
+        for row in rows:
+            line = (f"{library:>9} {row['case']:<30} {row['solvents']:>7} {row['p50_ms']:>9.2f} "
+                    f"{row['p99_ms']:>9.2f} {row['throughput_rps']:>9.1f} {row['peak_alloc_kb']:>9.0f}")
+            base = next((b for b in baseline.get(library, []) if b["case"] == row["case"]), None)
+            if base:
+                ratio = row["p50_ms"] / base["p50_ms"]
+                line += f" {ratio:>11.2f}x"
+                if ratio > REGRESSION_RATIO:
+                    line += "  REGRESSION"
+                    regressions.append((library, row["case"], ratio))
+            print(line)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="synthetic library sizes; 0 is the bundled database")
+    parser.add_argument("--budget", type=float, default=1.0, help="seconds per case")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare p50 against")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_cases(args.budget)))
+        return 0
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            results[str(size) if size else "bundled"] = run_library(size, args.budget, directory)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    regressions = print_table(results, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "results": results}, f, indent=2)
+    if regressions and args.fail_on_regression:
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
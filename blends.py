@@ -0,0 +1,166 @@
+import numpy as np
+import engine
+
+# Combinations are evaluated in chunks of at most this many, best lower bound
+# first, and small enough that the chunk × fractions × 3 blend array stays
+# around CHUNK_ELEMENTS
+EVAL_CHUNK = 4096
+CHUNK_ELEMENTS = 2_000_000
+# Finest composition step; a ternary grid at 0.01 already has 4851 fractions
+MIN_STEP = 0.01
+
+def composition_grid(units, n_components):
+    """All volume-fraction vectors with every component at least one step"""
+    if n_components == 2:
+        a = np.arange(1, units)
+        counts = np.stack([a, units - a], axis=1)
+    else:
+        a, b = np.meshgrid(np.arange(1, units), np.arange(1, units), indexing="ij")
+        a, b = a.ravel(), b.ravel()
+        keep = a + b < units
+        counts = np.stack([a[keep], b[keep], units - a[keep] - b[keep]], axis=1)
+    return counts / units
+
+def segment_distances(x, a, b):
+    """Distance from point x to segments a[i]-b[i] (scaled coordinates)"""
+    ab = b - a
+    length2 = np.einsum("ij,ij->i", ab, ab)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.einsum("ij,ij->i", x - a, ab) / length2
+    t = np.clip(np.nan_to_num(t), 0, 1)
+    return np.linalg.norm(a + t[:, None] * ab - x, axis=1)
+
+def triangle_distances(x, a, b, c, edges):
+    """Distance from x to triangles a-b-c, falling back to edge distances off-face"""
+    e0, e1, v = b - a, c - a, x - a
+    d00 = np.einsum("ij,ij->i", e0, e0)
+    d01 = np.einsum("ij,ij->i", e0, e1)
+    d11 = np.einsum("ij,ij->i", e1, e1)
+    d20 = np.einsum("ij,ij->i", v, e0)
+    d21 = np.einsum("ij,ij->i", v, e1)
+    denom = d00 * d11 - d01**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = (d11 * d20 - d01 * d21) / denom
+        t = (d00 * d21 - d01 * d20) / denom
+        on_face = (denom > 1e-12) & (s >= 0) & (t >= 0) & (s + t <= 1)
+        face = np.linalg.norm(v - s[:, None] * e0 - t[:, None] * e1, axis=1)
+    return np.where(on_face, face, edges)
+
+def pair_bounds(x, points):
+    """Closest approach of every pair's blend segment to x, as an N×N matrix"""
+    i, j = np.triu_indices(len(points), k=1)
+    bounds = np.full((len(points), len(points)), np.inf)
+    bounds[i, j] = bounds[j, i] = segment_distances(x, points[i], points[j])
+    return bounds
+
+def triple_bounds(args):
+    """Triples (i < j < k) for a block of i whose triangle comes within cutoff of x"""
+    x, points, edges, first, last, cutoff = args
+    found, bounds = [], []
+    n = len(points)
+    rel = points - x
+    reach = np.linalg.norm(rel, axis=1)
+    for i in range(first, last):
+        j, k = np.triu_indices(n - i - 1, k=1)
+        j, k = j + i + 1, k + i + 1
+        if reach[i] > cutoff:
+            # The plane through vertex i normal to x->i separates x from the
+            # triangle unless j or k projects back within cutoff of x
+            near = rel @ (rel[i] / reach[i]) <= cutoff
+            keep = near[j] | near[k]
+            j, k = j[keep], k[keep]
+        edge = np.minimum(np.minimum(edges[i, j], edges[j, k]), edges[i, k])
+        lb = triangle_distances(x, points[np.full(len(j), i)], points[j], points[k], edge)
+        keep = lb <= cutoff
+        found.append(np.stack([np.full(keep.sum(), i), j[keep], k[keep]], axis=1))
+        bounds.append(lb[keep])
+    if not found:
+        return np.empty((0, 3), dtype=np.intp), np.empty(0)
+    return np.concatenate(found), np.concatenate(bounds)
+
+def best_in_chunk(x, points, combos, fractions):
+    """Best grid composition (distance, fraction row) for each combination"""
+    blends = np.einsum("fk,tkc->tfc", fractions, points[combos])
+    dist = np.linalg.norm(blends - x, axis=2)
+    best = dist.argmin(axis=1)
+    return dist[np.arange(len(combos)), best], best
+
+def rank(x, points, combos, bounds, fractions, top, top_k):
+    """Evaluate combinations in lower-bound order, stopping once none can enter the top-K"""
+    order = np.argsort(bounds, kind="stable")
+    combos, bounds = combos[order], bounds[order]
+    size = max(1, min(EVAL_CHUNK, CHUNK_ELEMENTS // (3 * len(fractions))))
+    for start in range(0, len(combos), size):
+        if len(top) >= top_k and bounds[start] > top[-1][0]:
+            break
+        chunk = combos[start:start + size]
+        dist, best = best_in_chunk(x, points, chunk, fractions)
+        top.extend(zip(dist.tolist(), map(tuple, chunk.tolist()), fractions[best].tolist()))
+        top.sort(key=lambda item: item[0])
+        del top[top_k:]
+    return top
+
+def search_blends(solute, indices, step=0.05, top_k=10, ternary=False, processes=0):
+    """Rank binary (and optionally ternary) blends of the given solvents by RED
+
+    Each combination is scored at its best composition on the volume-fraction
+    grid, so the result holds top_k distinct blends rather than neighbouring
+    fractions of the same pair.
+    """
+    step_error = f"Step must evenly divide 1 and be between {MIN_STEP} and 0.5"
+    if not MIN_STEP <= step <= 0.5:
+        raise ValueError(step_error)
+    units = int(round(1 / step))
+    if units < 2 or not np.isclose(units * step, 1):
+        raise ValueError(step_error)
+    if ternary and units < 3:
+        raise ValueError("Ternary blends need a step of at most 1/3")
+    if top_k < 1:
+        raise ValueError("top_k must be positive")
+
+    indices = np.asarray(indices, dtype=np.intp)
+    points = engine.scaled(engine.SOLVENT_MATRIX[indices])
+    x = engine.scaled([solute["d"], solute["p"], solute["h"]])
+    top = []
+    n = len(points)
+    candidates = 0
+
+    edges = pair_bounds(x, points)
+    pairs = np.stack(np.triu_indices(n, k=1), axis=1)
+    candidates += len(pairs) * (units - 1)
+    rank(x, points, pairs, edges[pairs[:, 0], pairs[:, 1]],
+         composition_grid(units, 2), top, top_k)
+
+    if ternary and n >= 3:
+        fractions = composition_grid(units, 3)
+        candidates += n * (n - 1) * (n - 2) // 6 * len(fractions)
+        # Triangles farther away than the current K-th best cannot improve the ranking
+        cutoff = top[-1][0] if len(top) >= top_k else np.inf
+        blocks = np.array_split(np.arange(n - 2), max(1, processes) * 4)
+        tasks = [(x, points, edges, b[0], b[-1] + 1, cutoff) for b in blocks if len(b)]
+        if processes > 1:
+            # Imported here: multiprocessing is slow to import and rarely used
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                parts = list(pool.map(triple_bounds, tasks))
+        else:
+            parts = [triple_bounds(task) for task in tasks]
+        triples = np.concatenate([p[0] for p in parts])
+        bounds = np.concatenate([p[1] for p in parts])
+        rank(x, points, triples, bounds, fractions, top, top_k)
+
+    blends = []
+    for dist, combo, fraction in top:
+        center = np.dot(fraction, engine.SOLVENT_MATRIX[indices[list(combo)]])
+        red = dist / solute["ro"]
+        blends.append({
+            "solvents": [engine.SOLVENT_NAMES[indices[i]] for i in combo],
+            "fractions": [round(f, 4) for f in fraction],
+            "d": round(float(center[0]), 2),
+            "p": round(float(center[1]), 2),
+            "h": round(float(center[2]), 2),
+            "ra": round(dist, 2),
+            "red": round(red, 2),
+            "solubility": engine.STATUS_LABELS[int(engine.status_codes(red))],
+        })
+    return {"blends": blends, "candidates": candidates}
@@ -0,0 +1,44 @@
+"""Convert an HSP library to the memory-mapped binary format (.hspb)
+
+    python convert_library.py solvents.hspb                   # bundled data/solvents.py
+    python convert_library.py solvents.hspb --input big.csv   # name,d,p,h[,alpha] CSV or .npz
+    python convert_library.py solutes.hspb --solutes          # solute libraries (adds ro)
+
+Point SOLUBIX_SOLVENTS_FILE / SOLUBIX_SOLUTES_FILE at the output.
+"""
+import argparse
+import logging
+import time
+from store import HSPStore, SOLUTE_COLUMNS, SOLVENT_COLUMNS, load
+
+logger = logging.getLogger(__name__)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="path of the .hspb file to write")
+    parser.add_argument("--input", help=".csv or .npz library (default: the bundled data module)")
+    parser.add_argument("--solutes", action="store_true",
+                        help="convert a solute library (d, p, h, ro) instead of solvents")
+    return parser.parse_args()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = parse_args()
+    columns = SOLUTE_COLUMNS if args.solutes else SOLVENT_COLUMNS
+    if args.input:
+        library = load(args.input, columns)
+    elif args.solutes:
+        from data.solutes import SOLUTES
+        library = HSPStore.from_dict(SOLUTES, columns)
+    else:
+        from data.solvents import SOLVENTS
+        library = HSPStore.from_dict(SOLVENTS, columns)
+
+    library.save_binary(args.output)
+    start = time.perf_counter()
+    reloaded = HSPStore.from_binary(args.output)
+    logger.info("Wrote %d entries to %s (reloads in %.1f ms)", len(reloaded), args.output,
+                (time.perf_counter() - start) * 1000)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Group contributions for HSP estimation (Hoftyzer–Van Krevelen method)
+# "fd": dispersion F (J^1/2 cm^3/2 mol^-1), "fp": polar F (J^1/2 cm^3/2 mol^-1),
+# "eh": hydrogen-bonding energy (J/mol), "v": molar volume (cm^3/mol, Fedors).
+# Contributions not tabulated by Van Krevelen are 0.
+GROUPS = {
+    "-CH3": {"fd": 420, "fp": 0, "eh": 0, "v": 33.5},
+    "-CH2-": {"fd": 270, "fp": 0, "eh": 0, "v": 16.1},
+    ">CH-": {"fd": 80, "fp": 0, "eh": 0, "v": -1.0},
+    ">C<": {"fd": -70, "fp": 0, "eh": 0, "v": -19.2},
+    "=CH2": {"fd": 400, "fp": 0, "eh": 0, "v": 28.5},
+    "=CH-": {"fd": 200, "fp": 0, "eh": 0, "v": 13.5},
+    "=C<": {"fd": 70, "fp": 0, "eh": 0, "v": -5.5},
+    "-C6H5": {"fd": 1430, "fp": 110, "eh": 0, "v": 71.4},
+    "-C6H4-": {"fd": 1270, "fp": 110, "eh": 0, "v": 52.4},
+    "-F": {"fd": 220, "fp": 0, "eh": 0, "v": 18.0},
+    "-Cl": {"fd": 450, "fp": 550, "eh": 400, "v": 24.0},
+    "-Br": {"fd": 550, "fp": 0, "eh": 0, "v": 30.0},
+    "-CN": {"fd": 430, "fp": 1100, "eh": 2500, "v": 24.0},
+    "-OH": {"fd": 210, "fp": 500, "eh": 20000, "v": 10.0},
+    "-O-": {"fd": 100, "fp": 400, "eh": 3000, "v": 3.8},
+    "-CHO": {"fd": 470, "fp": 800, "eh": 4500, "v": 22.3},
+    "-CO-": {"fd": 290, "fp": 770, "eh": 2000, "v": 10.8},
+    "-COOH": {"fd": 530, "fp": 420, "eh": 10000, "v": 28.5},
+    "-COO-": {"fd": 390, "fp": 490, "eh": 7000, "v": 18.0},
+    "HCOO-": {"fd": 530, "fp": 0, "eh": 0, "v": 32.5},
+    "-NH2": {"fd": 280, "fp": 0, "eh": 8400, "v": 19.2},
+    "-NH-": {"fd": 160, "fp": 210, "eh": 3100, "v": 4.5},
+    ">N-": {"fd": 20, "fp": 800, "eh": 5000, "v": -9.0},
+    "-NO2": {"fd": 500, "fp": 1070, "eh": 1500, "v": 24.0},
+    "-S-": {"fd": 440, "fp": 0, "eh": 0, "v": 12.0},
+    "=PO4-": {"fd": 740, "fp": 1890, "eh": 13000, "v": 28.0},
+    # Ring closure (five or more atoms), on top of the ring's own groups
+    "ring": {"fd": 190, "fp": 0, "eh": 0, "v": 16.0},
+}
@@ -1,28 +1,29 @@
 # Solvent database (HSP values)
+# Optional "alpha": volumetric thermal expansion coefficient (1/K) near 25 °C
 # spell-checker: disable
 SOLVENTS = {
-    "Water": {"d":15.5, "p": 16.0, "h": 42.3},
-    "Ethanol": {"d": 15.8, "p": 8.8, "h": 19.4},
-    "Acetone": {"d": 15.5, "p": 10.4, "h": 7.0},
-    "Toluene": {"d": 18.0, "p": 1.4, "h": 2.0},
-    "Hexane": {"d": 14.9, "p": 0.0, "h": 0.0},
+    "Water": {"d":15.5, "p": 16.0, "h": 42.3, "alpha": 2.57e-4},
+    "Ethanol": {"d": 15.8, "p": 8.8, "h": 19.4, "alpha": 1.09e-3},
+    "Acetone": {"d": 15.5, "p": 10.4, "h": 7.0, "alpha": 1.46e-3},
+    "Toluene": {"d": 18.0, "p": 1.4, "h": 2.0, "alpha": 1.07e-3},
+    "Hexane": {"d": 14.9, "p": 0.0, "h": 0.0, "alpha": 1.38e-3},
     "MTBE": {"d": 15.3, "p": 4.0, "h": 2.6},
-    "Ethyl acetate": {"d": 15.8, "p": 5.3, "h": 7.2},
+    "Ethyl acetate": {"d": 15.8, "p": 5.3, "h": 7.2, "alpha": 1.38e-3},
     "Methyl Isobutyl Ketone (MIBK)": {"d": 15.3, "p": 6.1, "h": 4.1},
-    "Heptane": {"d": 15.3, "p": 0.0, "h": 0.0},
+    "Heptane": {"d": 15.3, "p": 0.0, "h": 0.0, "alpha": 1.26e-3},
     "Rapeseed oil": {"d": 17.0, "p": 2.0, "h": 5.0},
-    "Dimethyl sulfoxide (DMSO)": {"d": 18.4, "p": 16.4, "h": 10.2},
+    "Dimethyl sulfoxide (DMSO)": {"d": 18.4, "p": 16.4, "h": 10.2, "alpha": 8.8e-4},
     "Propylene carbonate": {"d": 20.0, "p": 18.0, "h": 4.1},
     "N-Methyl-2-pyrrolidone (NMP)": {"d": 18.0, "p": 12.3, "h": 7.2},
     "γ-Butyrolactone (GBL)": {"d": 19.0, "p": 16.6, "h": 7.4},
-    "Chloroform": {"d": 17.8, "p": 3.1, "h": 5.7},
-    "Acetonitrile": {"d": 15.3, "p": 18.0, "h": 6.1},
-    "Dichloromethane (DCM)": {"d": 18.2, "p": 6.3, "h": 7.1},
+    "Chloroform": {"d": 17.8, "p": 3.1, "h": 5.7, "alpha": 1.27e-3},
+    "Acetonitrile": {"d": 15.3, "p": 18.0, "h": 6.1, "alpha": 1.37e-3},
+    "Dichloromethane (DCM)": {"d": 18.2, "p": 6.3, "h": 7.1, "alpha": 1.37e-3},
     "Anisole": {"d": 17.8, "p": 4.4, "h": 6.9},
     "Cyclohexanone": {"d": 17.8, "p": 8.4, "h": 5.1},
     "Tetrahydrofuran": {"d": 16.8, "p": 5.7, "h": 8.0},
     "Acetaldehyde" : {"d": 14.7, "p": 12.5, "h":7.9},
-    "Acetic acid" : {"d": 14.5, "p": 8.0, "h":13.5},
+    "Acetic acid" : {"d": 14.5, "p": 8.0, "h":13.5, "alpha": 1.07e-3},
     "Acetic Anhydride" : {"d": 16.0, "p": 11.7, "h":10.2},
     "Acetophenone" : {"d": 18.8, "p": 9.0, "h":4.0},
     "Acrylonitrile" : {"d": 16.0, "p": 12.8, "h":6.8},
@@ -93,7 +94,7 @@ SOLVENTS = {
     "1,1-Dichloroethane": {"d": 16.5, "p": 7.8, "h": 3.0},
     "1,2-Dichloroethylene": {"d": 17.0, "p": 8.0, "h": 3.2},
     "Dichloroethylene": {"d": 16.7, "p": 7.8, "h": 3.3},
-    "Dichloromethane": {"d": 18.2, "p": 6.3, "h": 6.1},
+    "Dichloromethane": {"d": 18.2, "p": 6.3, "h": 6.1, "alpha": 1.37e-3},
     "Dichloromonofluorimethane (Freon 21)": {"d": 15.8, "p": 3.1, "h": 5.7},
     "1,2-Dichlorotetrafluoroethane (Freon 114)": {"d": 12.6, "p": 1.8, "h": 0},
     "Diethanolamine": {"d": 17.2, "p": 7.0, "h": 19.0},
@@ -174,7 +175,7 @@ SOLVENTS = {
     "Mesityl Oxide": {"d": 16.4, "p": 7.2, "h": 5.0},
     "Mesitylene": {"d": 18.0, "p": 0.6, "h": 0.6},
     "Methacrylonitrile": {"d": 15.8, "p": 9.5, "h": 5.4},
-    "Methanol": {"d": 14.7, "p": 12.3, "h": 22.3},
+    "Methanol": {"d": 14.7, "p": 12.3, "h": 22.3, "alpha": 1.19e-3},
     "2-Methoxy-2-methylpropane": {"d": 14.8, "p": 4.3, "h": 5.0},
     "o-Methoxyphenol": {"d": 18.0, "p": 7.0, "h": 12.0},
     "Methyl Acetate": {"d": 15.5, "p": 7.2, "h": 7.6},
@@ -0,0 +1,122 @@
+import numpy as np
+from store import SOLVENT_STORE
+
+# Solvent matrix ---------------------------------------------------------------
+# Built once at import so requests only index into it instead of walking dicts
+SOLVENT_NAMES = SOLVENT_STORE.names
+SOLVENT_INDEX = SOLVENT_STORE.index
+SOLVENT_MATRIX = SOLVENT_STORE.values
+
+# Temperature model ------------------------------------------------------------
+# Database values are at 25 °C. Hansen's thermal-expansion relations give
+#   dδD/dT = -1.25·α·δD,  dδP/dT = -0.5·α·δP,  dδH/dT = -(1.22e-3 + 0.5·α)·δH
+# with α the volumetric expansion coefficient (1/K). Entries without an
+# "alpha" fall back to typical values for organic liquids and solids.
+REFERENCE_TEMPERATURE = 25.0
+DEFAULT_SOLVENT_ALPHA = 1.0e-3
+DEFAULT_SOLUTE_ALPHA = 3.0e-4
+SOLVENT_ALPHA = SOLVENT_STORE.extra("alpha", DEFAULT_SOLVENT_ALPHA)
+
+TEMPERATURES = np.linspace(0, 100, 101)
+
+# Status codes index into these tuples (0 = Soluble, 1 = Partial, 2 = Insoluble)
+STATUS_LABELS = ("Soluble", "Partially Soluble", "Insoluble")
+STATUS_COLORS = ("green", "orange", "red")
+RED_THRESHOLDS = np.array([1.0, 1.5])
+
+def scaled(points):
+    """Map (d, p, h) to (2d, p, h) so Hansen distance becomes plain Euclidean"""
+    points = np.array(points, dtype=np.float64)
+    points[..., 0] *= 2
+    return points
+
+def hsp_distance(center, points):
+    """Hansen distance (Ra) from one (d, p, h) center to an N×3 array of points"""
+    points = np.asarray(points, dtype=np.float64)
+    dd = center[0] - points[:, 0]
+    dp = center[1] - points[:, 1]
+    dh = center[2] - points[:, 2]
+    return np.sqrt(4 * dd**2 + dp**2 + dh**2)
+
+def hsp_distance_matrix(centers, points):
+    """Hansen distances between an M×3 array of centers and an N×3 array of points (M×N)"""
+    centers = np.asarray(centers, dtype=np.float64)
+    points = np.asarray(points, dtype=np.float64)
+    dd = centers[:, None, 0] - points[None, :, 0]
+    dp = centers[:, None, 1] - points[None, :, 1]
+    dh = centers[:, None, 2] - points[None, :, 2]
+    return np.sqrt(4 * dd**2 + dp**2 + dh**2)
+
+def status_codes(red):
+    """Map RED values to status codes: RED <= 1 Soluble, <= 1.5 Partially Soluble, else Insoluble"""
+    return np.searchsorted(RED_THRESHOLDS, red, side="left")
+
+def temperature_grid(t_min=0.0, t_max=100.0, points=101):
+    """Evenly spaced temperatures (°C) for RED(T) curves"""
+    if not t_min < t_max:
+        raise ValueError("temp_min must be below temp_max")
+    if not 2 <= points <= 1001:
+        raise ValueError("temp_points must be between 2 and 1001")
+    return np.linspace(t_min, t_max, points)
+
+def temperature_shift(alpha, temperatures):
+    """δD/δP/δH scale factors, shape alpha.shape + (T, 3), relative to 25 °C"""
+    alpha = np.asarray(alpha, dtype=np.float64)[..., None]
+    dt = np.asarray(temperatures, dtype=np.float64) - REFERENCE_TEMPERATURE
+    return np.stack([1 - 1.25 * alpha * dt,
+                     1 - 0.5 * alpha * dt,
+                     1 - (1.22e-3 + 0.5 * alpha) * dt], axis=-1)
+
+def red_vs_temperature(solute, indices, temperatures):
+    """RED of each solvent row at each temperature as one (solvents × temperatures) array"""
+    center = np.array([solute["d"], solute["p"], solute["h"]], dtype=np.float64)
+    solute_t = center * temperature_shift(solute.get("alpha", DEFAULT_SOLUTE_ALPHA), temperatures)
+    solvents_t = SOLVENT_MATRIX[indices][:, None, :] * temperature_shift(
+        SOLVENT_ALPHA[indices], temperatures)
+    diff = solute_t[None, :, :] - solvents_t
+    ra = np.sqrt(4 * diff[..., 0]**2 + diff[..., 1]**2 + diff[..., 2]**2)
+    return ra / solute["ro"]
+
+def lookup_solvents(names):
+    """Split requested names into matrix row indices and unknown names"""
+    indices, missing = [], []
+    for name in names:
+        idx = SOLVENT_INDEX.get(name)
+        if idx is None:
+            missing.append(name)
+        else:
+            indices.append(idx)
+    return np.array(indices, dtype=np.intp), missing
+
+def red_matrix(solutes):
+    """RED of every solute (rows, as d/p/h/ro dicts) against every solvent in the matrix"""
+    centers = np.array([[s["d"], s["p"], s["h"]] for s in solutes], dtype=np.float64)
+    ro = np.array([s["ro"] for s in solutes], dtype=np.float64)
+    return hsp_distance_matrix(centers.reshape(-1, 3), SOLVENT_MATRIX) / ro[:, None]
+
+def evaluate(solute, indices, temperature=25.0, temperatures=TEMPERATURES, red=None):
+    """Compute Ra, RED, status codes and temperature curves for solvent rows in one pass
+
+    Ra, RED and status are at 25 °C; red, when given, is a precomputed RED for
+    these rows (see red_cache.red_values) and replaces that distance
+    computation. Curves are 1/RED(T) from the thermal-expansion model.
+    """
+    points = SOLVENT_MATRIX[indices]
+    if red is None:
+        ra = hsp_distance((solute["d"], solute["p"], solute["h"]), points)
+        red = ra / solute["ro"]
+    else:
+        ra = red * solute["ro"]
+
+    # Solubility index 1/RED at the requested temperature and across the grid
+    red_t = red_vs_temperature(solute, indices, np.append(temperatures, temperature))
+    with np.errstate(divide="ignore"):
+        solubility_t = 1 / red_t
+    return {
+        "points": points,
+        "ra": ra,
+        "red": red,
+        "codes": status_codes(red),
+        "temp_corrected": solubility_t[:, -1],
+        "curves": solubility_t[:, :-1],
+    }
@@ -0,0 +1,75 @@
+from functools import lru_cache
+import numpy as np
+from data.groups import GROUPS
+
+# Hoftyzer–Van Krevelen: δD = ΣFd/V, δP = √(ΣFp²)/V, δH = √(ΣEh/V).
+# δP is scaled down for symmetric molecules by the number of symmetry planes.
+GROUP_NAMES = tuple(GROUPS)
+GROUP_INDEX = {name: i for i, name in enumerate(GROUP_NAMES)}
+# Columns: Fd, Fp², Eh, V, so every sum is a single matrix product
+CONTRIBUTIONS = np.array([[g["fd"], g["fp"] ** 2, g["eh"], g["v"]] for g in GROUPS.values()],
+                         dtype=np.float64)
+SYMMETRY_FACTORS = (1.0, 0.5, 0.25, 0.0)
+ESTIMATE_CACHE_SIZE = 4096
+
+def group_vector(groups):
+    """Canonical count vector (tuple in GROUP_NAMES order) for a {group: count} dict"""
+    if not isinstance(groups, dict) or not groups:
+        raise ValueError("groups must be a non-empty {group: count} object")
+    vector = [0] * len(GROUP_NAMES)
+    for name, count in groups.items():
+        if name not in GROUP_INDEX:
+            raise ValueError(f"Unknown group {name!r}")
+        if isinstance(count, bool) or not isinstance(count, (int, float)) or count < 0 \
+                or count != int(count):
+            raise ValueError(f"Count for group {name!r} must be a non-negative integer")
+        vector[GROUP_INDEX[name]] += int(count)
+    return tuple(vector)
+
+def symmetry_factor(planes):
+    """δP multiplier for 0, 1, 2 or 3+ planes of symmetry"""
+    try:
+        planes = int(planes)
+    except (TypeError, ValueError):
+        raise ValueError("symmetry_planes must be an integer")
+    if planes < 0:
+        raise ValueError("symmetry_planes must be non-negative")
+    return SYMMETRY_FACTORS[min(planes, len(SYMMETRY_FACTORS) - 1)]
+
+def estimate_matrix(counts, factors):
+    """δD/δP/δH and molar volume for an M×G group-count matrix, as an M×4 array"""
+    counts = np.asarray(counts, dtype=np.float64).reshape(-1, len(GROUP_NAMES))
+    fd, fp2, eh, v = (counts @ CONTRIBUTIONS).T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.column_stack((fd / v, np.asarray(factors) * np.sqrt(fp2) / v,
+                                np.sqrt(eh / v), v))
+
+def check_volumes(estimates):
+    bad = np.flatnonzero(~(estimates[:, 3] > 0))
+    if bad.size:
+        raise ValueError(f"Molar volume of molecule {int(bad[0])} is not positive; "
+                         "check its group counts")
+
+@lru_cache(maxsize=ESTIMATE_CACHE_SIZE)
+def _estimate(vector, factor):
+    estimates = estimate_matrix([vector], [factor])
+    check_volumes(estimates)
+    d, p, h, v = estimates[0].tolist()
+    return d, p, h, v
+
+def estimate(groups, symmetry_planes=0):
+    """Estimated {"d", "p", "h", "v"} for one molecule, memoized by group vector"""
+    d, p, h, v = _estimate(group_vector(groups), symmetry_factor(symmetry_planes))
+    return {"d": d, "p": p, "h": h, "v": v}
+
+def estimate_batch(molecules):
+    """M×4 estimates for many {"groups", "symmetry_planes"} entries in one matrix product
+
+    Identical group vectors are computed once.
+    """
+    vectors = np.array([group_vector(m.get("groups")) for m in molecules], dtype=np.int64)
+    factors = np.array([symmetry_factor(m.get("symmetry_planes", 0)) for m in molecules])
+    unique, inverse = np.unique(np.column_stack((vectors, factors)), axis=0, return_inverse=True)
+    estimates = estimate_matrix(unique[:, :-1], unique[:, -1])[inverse.reshape(-1)]
+    check_volumes(estimates)
+    return estimates
@@ -0,0 +1,76 @@
+import numpy as np
+import engine
+
+# Candidate centers evaluated per refinement level are split into chunks so the
+# centers × points distance matrix stays around this many elements
+CHUNK_ELEMENTS = 2_000_000
+
+def best_radius(ra, good):
+    """Optimal Ro and hinge loss for each row of an M×N distance matrix
+
+    The loss is -log of Hansen's desirability product: good points outside the
+    sphere cost (Ra - Ro), bad points inside cost (Ro - Ra). Its slope in Ro is
+    (points with Ra <= Ro) - (good points), so the smallest minimizer is the
+    n_good-th smallest Ra of the row and needs only a partition, not a sort.
+    """
+    k = int(good.sum()) - 1
+    ro = np.partition(ra, k, axis=1)[:, k]
+    excess = ra - ro[:, None]
+    loss = np.where(good, np.maximum(excess, 0), np.maximum(-excess, 0)).sum(axis=1)
+    return ro, loss
+
+def score_centers(centers, points, good):
+    """Best (Ro, loss) for every candidate center, chunked to bound memory"""
+    chunk = max(1, CHUNK_ELEMENTS // len(points))
+    ro = np.empty(len(centers))
+    loss = np.empty(len(centers))
+    for start in range(0, len(centers), chunk):
+        ra = engine.hsp_distance_matrix(centers[start:start + chunk], points)
+        ro[start:start + chunk], loss[start:start + chunk] = best_radius(ra, good)
+    return ro, loss
+
+def fit_sphere(points, good, steps=9, tolerance=0.01, max_levels=30):
+    """Fit solute (d, p, h, Ro) to good/bad solvent points by coarse-to-fine grid search"""
+    points = np.asarray(points, dtype=np.float64)
+    good = np.asarray(good, dtype=bool)
+    # A single good point (or several at the same spot) fits a sphere of radius 0
+    if len(np.unique(points[good], axis=0)) < 2:
+        raise ValueError("At least two distinct good solvents are required")
+
+    low = points[good].min(axis=0)
+    high = points[good].max(axis=0)
+    center = (low + high) / 2
+    half_span = np.maximum((high - low) / 2, 1.0)
+    offsets = np.linspace(-1, 1, steps)
+
+    best = None
+    for _ in range(max_levels):
+        axes = [center[i] + half_span[i] * offsets for i in range(3)]
+        grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+        grid[:, 0] = np.maximum(grid[:, 0], 0)
+        ro, loss = score_centers(grid, points, good)
+
+        # Lexicographic (loss, Ro) so equally good fits prefer the tighter sphere
+        i = np.lexsort((ro, np.round(loss, 9)))[0]
+        if best is None or (round(loss[i], 9), ro[i]) <= (round(best[2], 9), best[1]):
+            best = (grid[i], ro[i], loss[i])
+        center = best[0]
+        # Next level spans two grid steps either side of the best center
+        half_span = half_span * 4 / (steps - 1)
+        if half_span.max() < tolerance:
+            break
+
+    center, ro, loss = best
+    ra = engine.hsp_distance(center, points)
+    inside = ra <= ro
+    return {
+        "d": round(float(center[0]), 2),
+        "p": round(float(center[1]), 2),
+        "h": round(float(center[2]), 2),
+        "ro": round(float(ro), 2),
+        "fit": round(float(np.exp(-loss / len(points))), 4),
+        "good_inside": int((inside & good).sum()),
+        "good_total": int(good.sum()),
+        "bad_outside": int((~inside & ~good).sum()),
+        "bad_total": int((~good).sum()),
+    }
@@ -0,0 +1,62 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Heavy work (plot building, blend searches, sphere fits) runs on a small pool
+# so a burst of slow requests cannot occupy every server thread. Requests
+# beyond workers + queue are rejected instead of piling up. Each admitted task
+# also holds the request thread waiting on it, so with a fixed number of server
+# threads admission is capped below that number (see configure).
+HEAVY_WORKERS = int(os.environ.get("SOLUBIX_HEAVY_WORKERS", 2))
+HEAVY_QUEUE = int(os.environ.get("SOLUBIX_HEAVY_QUEUE", 8))
+HEAVY_TIMEOUT = float(os.environ.get("SOLUBIX_HEAVY_TIMEOUT", 30))
+# Server threads always left free for cheap routes
+RESERVED_THREADS = int(os.environ.get("SOLUBIX_RESERVED_THREADS", 1))
+
+class Busy(Exception):
+    """Raised when the heavy-work pool and its queue are full"""
+
+_lock = threading.Lock()
+_executor = None
+_slots = None
+_pid = None
+_admit = HEAVY_WORKERS + HEAVY_QUEUE
+
+def configure(server_threads):
+    """Cap admitted heavy tasks so RESERVED_THREADS of server_threads stay free
+
+    Call before serving; at least one task is always admitted.
+    """
+    global _admit, _executor
+    with _lock:
+        _admit = max(1, min(HEAVY_WORKERS + HEAVY_QUEUE, server_threads - RESERVED_THREADS))
+        _executor = None
+    return _admit
+
+def _pool():
+    """Per-process executor, created lazily because threads do not survive fork"""
+    global _executor, _slots, _pid
+    with _lock:
+        if _executor is None or _pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=min(HEAVY_WORKERS, _admit),
+                                           thread_name_prefix="solubix-heavy")
+            _slots = threading.BoundedSemaphore(_admit)
+            _pid = os.getpid()
+        return _executor, _slots
+
+def run(fn, *args, **kwargs):
+    """Run fn on the heavy-work pool and wait for its result
+
+    Raises Busy without waiting when the pool is saturated. A timed-out task
+    keeps its slot until it actually finishes.
+    """
+    executor, slots = _pool()
+    if not slots.acquire(blocking=False):
+        raise Busy("Server is busy, try again shortly")
+    try:
+        future = executor.submit(fn, *args, **kwargs)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future.result(timeout=HEAVY_TIMEOUT)
@@ -0,0 +1,60 @@
+import threading
+import time
+from collections import OrderedDict
+
+class LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used entry
+
+    With a ttl (seconds), entries also expire when not used for that long.
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry time or None, value), least recently used first
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def _expiry(self):
+        return time.monotonic() + self.ttl if self.ttl is not None else None
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+                self._data.pop(key, None)
+                self.misses += 1
+                return default
+            self._data[key] = (self._expiry(), entry[1])
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (self._expiry(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            # Use refreshes the expiry, so expired entries are always at the front
+            if self.ttl is not None:
+                now = time.monotonic()
+                while self._data:
+                    expiry, _ = next(iter(self._data.values()))
+                    if expiry >= now:
+                        break
+                    self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,149 @@
+import bisect
+import os
+import threading
+import time
+from contextlib import nullcontext
+from flask import Response, g, has_request_context, request
+
+# SOLUBIX_METRICS=0 turns all instrumentation into no-ops; Server-Timing
+# headers are opt-in with SOLUBIX_SERVER_TIMING=1
+ENABLED = os.environ.get("SOLUBIX_METRICS", "1") != "0"
+SERVER_TIMING = ENABLED and os.environ.get("SOLUBIX_SERVER_TIMING", "0") == "1"
+
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NULL_STAGE = nullcontext()
+
+class Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name, self.help, self.label_names = name, help_text, label_names
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{format_labels(self.label_names, labels)} {value}")
+        return lines
+
+class Histogram:
+    def __init__(self, name, help_text, label_names, buckets=BUCKETS):
+        self.name, self.help, self.label_names = name, help_text, label_names
+        self.buckets = buckets
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, seconds):
+        i = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            row = self.values.get(labels)
+            if row is None:
+                row = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[i] += 1
+            row[-1] += seconds
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, row in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), row[:-1]):
+                cumulative += count
+                bucket_labels = format_labels(self.label_names + ("le",), labels + (str(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            base = format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{base} {row[-1]:.6f}")
+            lines.append(f"{self.name}_count{base} {cumulative}")
+        return lines
+
+def format_labels(names, values):
+    if not names:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+               for v in values)
+    return "{" + ",".join(f'{n}="{v}"' for n, v in zip(names, escaped)) + "}"
+
+REQUESTS = Counter("solubix_requests_total", "Requests handled by route, method and status",
+                   ("route", "method", "status"))
+REQUEST_SECONDS = Histogram("solubix_request_duration_seconds",
+                            "Request handling time by route", ("route",))
+STAGE_SECONDS = Histogram("solubix_stage_duration_seconds",
+                          "Time spent in instrumented hot-path stages", ("stage",))
+
+# name -> callable returning (hits, misses), read at scrape time
+caches = {}
+
+def register_cache(name, stats):
+    caches[name] = stats
+
+def cache_lines():
+    lines = []
+    for kind in ("hits", "misses"):
+        lines += [f"# HELP solubix_cache_{kind}_total Cache {kind} by cache",
+                  f"# TYPE solubix_cache_{kind}_total counter"]
+        for name, stats in sorted(caches.items()):
+            value = stats()[0 if kind == "hits" else 1]
+            lines.append(f"solubix_cache_{kind}_total{format_labels(('cache',), (name,))} {value}")
+    return lines
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        STAGE_SECONDS.observe((self.name,), elapsed)
+        if SERVER_TIMING and has_request_context():
+            g.setdefault("stages", []).append((self.name, elapsed))
+        return False
+
+def stage(name):
+    """Context manager timing one named stage; a shared no-op when metrics are disabled"""
+    if not ENABLED:
+        return _NULL_STAGE
+    return _Stage(name)
+
+def render():
+    lines = REQUESTS.render() + REQUEST_SECONDS.render() + STAGE_SECONDS.render()
+    if caches:
+        lines += cache_lines()
+    return "\n".join(lines) + "\n"
+
+def init_app(app):
+    """Register request timing hooks and the /metrics endpoint"""
+    if not ENABLED:
+        return
+
+    @app.before_request
+    def start_timer():
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        start = g.get("request_start")
+        if start is None:
+            return response
+        elapsed = time.perf_counter() - start
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        REQUESTS.inc((route, request.method, str(response.status_code)))
+        REQUEST_SECONDS.observe((route,), elapsed)
+        if SERVER_TIMING:
+            timings = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in g.get("stages", [])]
+            timings.append(f"total;dur={elapsed * 1000:.2f}")
+            response.headers["Server-Timing"] = ", ".join(timings)
+        return response
+
+    @app.route("/metrics")
+    def prometheus_metrics():
+        """Prometheus text exposition of this process's counters and histograms"""
+        return Response(render(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,174 @@
+import base64
+import json
+import threading
+import numpy as np
+from lru import LRUCache
+
+# plotly is imported on first use: it is the slowest import in the app and
+# only the figure routes need it (warm_up() loads it before workers fork)
+
+PLOT_CACHE_SIZE = 512
+
+SCENE = dict(
+    xaxis_title="δD (Dispersion)",
+    yaxis_title="δP (Polar)",
+    zaxis_title="δH (Hydrogen Bonding)",
+    aspectmode='cube',
+    camera=dict(eye=dict(x=1.5, y=1.5, z=1.2))
+)
+
+# Unit sphere mesh, scaled and shifted per solute
+U, V = np.mgrid[0:2*np.pi:20j, 0:np.pi:10j]
+COS_U, SIN_U, COS_V, SIN_V = np.cos(U), np.sin(U), np.cos(V), np.sin(V)
+
+figure_cache = LRUCache(PLOT_CACHE_SIZE)
+
+# Plotly reference figure ------------------------------------------------------
+def build_figure(plot_data, solute=None):
+    """Generate 3D plot using Plotly"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+
+    # Add solvent points
+    fig.add_trace(go.Scatter3d(
+        x=plot_data["d_values"],
+        y=plot_data["p_values"],
+        z=plot_data["h_values"],
+        mode="markers+text",
+        marker=dict(size=10, color=plot_data["colors"], colorscale="Viridis"),
+        text=plot_data["solvents"],
+        hovertext=solvent_hovertext(plot_data),
+        name="Solvents"
+    ))
+
+    # Add solute visualization if provided
+    if solute:
+        add_solute_to_plot(fig, solute)
+
+    fig.update_layout(
+        scene=SCENE,
+        margin=dict(l=0, r=0, b=0, t=30),
+        height=600
+    )
+    return fig
+
+def add_solute_to_plot(fig, solute):
+    """Add solute and solubility sphere to plot"""
+    import plotly.graph_objects as go
+    fig.add_trace(go.Scatter3d(
+        x=[solute["d"]], y=[solute["p"]], z=[solute["h"]],
+        mode="markers+text",
+        marker=dict(size=14, color="blue", symbol="diamond"),
+        text=["Solute"],
+        hovertext=solute_hovertext(solute),
+        name="Solute"
+    ))
+
+    if "ro" in solute:
+        x, y, z = sphere_mesh(solute)
+        fig.add_trace(go.Surface(
+            x=x, y=y, z=z, opacity=0.2,
+            colorscale=[[0, 'blue'], [1, 'blue']],
+            showscale=False,
+            name="Solubility Sphere"
+        ))
+
+# Lightweight builder ----------------------------------------------------------
+# Emits the same trace dicts plotly would after validation, in the same key
+# order, so the JSON is byte-identical to build_figure(...).to_json()
+_reference = None
+_reference_lock = threading.Lock()
+
+def reference_parts():
+    """Serialized layout and expanded Viridis colorscale, taken once from plotly"""
+    global _reference
+    if _reference is None:
+        with _reference_lock:
+            if _reference is None:
+                from plotly.io.json import to_json_plotly
+                sample = {"solvents": ["x"], "d_values": [0.0], "p_values": [0.0],
+                          "h_values": [0.0], "colors": ["green"]}
+                fig = json.loads(build_figure(sample).to_json())
+                # Published in one assignment so readers never see a partial dict
+                _reference = {"layout": to_json_plotly(fig["layout"]),
+                              "colorscale": fig["data"][0]["marker"]["colorscale"]}
+    return _reference
+
+def solvent_hovertext(plot_data):
+    return [f"{name}: δD={d:.1f}, δP={p:.1f}, δH={h:.1f}"
+            for name, d, p, h in zip(plot_data["solvents"],
+                                     plot_data["d_values"],
+                                     plot_data["p_values"],
+                                     plot_data["h_values"])]
+
+def solute_hovertext(solute):
+    return f"Solute: δD={solute['d']:.1f}, δP={solute['p']:.1f}, δH={solute['h']:.1f}"
+
+def sphere_mesh(solute):
+    """Solubility sphere surface grid (x, y, z) around the solute center"""
+    x = solute["ro"] * COS_U*SIN_V + solute["d"]
+    y = solute["ro"] * SIN_U*SIN_V + solute["p"]
+    z = solute["ro"] * COS_V + solute["h"]
+    return x, y, z
+
+def typed_array(values):
+    """plotly.js typed-array spec for a float64 grid"""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    return {
+        "dtype": "f8",
+        "bdata": base64.b64encode(values).decode("ascii"),
+        "shape": str(values.shape)[1:-1],
+    }
+
+def figure_traces(plot_data, solute=None):
+    """Trace dicts for the solvent points, solute marker and solubility sphere"""
+    traces = [{
+        "hovertext": solvent_hovertext(plot_data),
+        "marker": {"color": plot_data["colors"],
+                   "colorscale": reference_parts()["colorscale"],
+                   "size": 10},
+        "mode": "markers+text",
+        "name": "Solvents",
+        "text": plot_data["solvents"],
+        "x": plot_data["d_values"],
+        "y": plot_data["p_values"],
+        "z": plot_data["h_values"],
+        "type": "scatter3d",
+    }]
+
+    if solute:
+        traces.append({
+            "hovertext": solute_hovertext(solute),
+            "marker": {"color": "blue", "size": 14, "symbol": "diamond"},
+            "mode": "markers+text",
+            "name": "Solute",
+            "text": ["Solute"],
+            "x": [solute["d"]],
+            "y": [solute["p"]],
+            "z": [solute["h"]],
+            "type": "scatter3d",
+        })
+        if "ro" in solute:
+            x, y, z = sphere_mesh(solute)
+            traces.append({
+                "colorscale": [[0, "blue"], [1, "blue"]],
+                "name": "Solubility Sphere",
+                "opacity": 0.2,
+                "showscale": False,
+                "x": typed_array(x),
+                "y": typed_array(y),
+                "z": typed_array(z),
+                "type": "surface",
+            })
+    return traces
+
+def figure_json(plot_data, solute=None):
+    """Figure JSON for the 3D plot without going through plotly's validation"""
+    from plotly.io.json import to_json_plotly
+    data = to_json_plotly(figure_traces(plot_data, solute))
+    return f'{{"data":{data},"layout":{reference_parts()["layout"]}}}'
+
+def cache_key(solute, indices):
+    """Figure cache key: solute parameters plus the set of solvent rows"""
+    return (solute["d"], solute["p"], solute["h"], solute.get("ro"),
+            tuple(sorted(set(indices))))
@@ -0,0 +1,53 @@
+import bisect
+import functools
+import numpy as np
+import engine
+
+CARRIER_CACHE_SIZE = 64
+
+@functools.lru_cache(maxsize=CARRIER_CACHE_SIZE)
+def carrier_distances(carrier_index):
+    """Ra from one solvent to every solvent in the database, computed once per carrier"""
+    distances = engine.hsp_distance(engine.SOLVENT_MATRIX[carrier_index], engine.SOLVENT_MATRIX)
+    distances.flags.writeable = False
+    return distances
+
+def pareto_front(objectives):
+    """Boolean mask of the non-dominated rows of an N×k objective matrix (all minimized)
+
+    Rows are swept in lexicographic order, so a row can only be dominated by
+    an earlier one: for two objectives that is a running minimum, for three a
+    staircase of the 2D front seen so far. Identical rows share one verdict.
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    n, k = objectives.shape
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    if k == 1:
+        keep = unique[:, 0] == unique[0, 0]
+    elif k == 2:
+        # unique is already sorted lexicographically
+        best = np.minimum.accumulate(unique[:, 1])
+        keep = np.ones(len(unique), dtype=bool)
+        keep[1:] = unique[1:, 1] < best[:-1]
+    elif k == 3:
+        keep = np.zeros(len(unique), dtype=bool)
+        stairs_f2, stairs_f3 = [], []  # f2 ascending, f3 strictly descending
+        for i, (_, f2, f3) in enumerate(unique.tolist()):
+            j = bisect.bisect_right(stairs_f2, f2)
+            if j and stairs_f3[j - 1] <= f3:
+                continue
+            keep[i] = True
+            # Drop staircase points the new one dominates in (f2, f3)
+            start = j - 1 if j and stairs_f2[j - 1] == f2 else j
+            end = j
+            while end < len(stairs_f2) and stairs_f3[end] >= f3:
+                end += 1
+            stairs_f2[start:end] = [f2]
+            stairs_f3[start:end] = [f3]
+    else:
+        raise ValueError("At most three objectives are supported")
+    return keep[inverse]
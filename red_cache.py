@@ -0,0 +1,89 @@
+import hashlib
+import logging
+import os
+import zipfile
+import numpy as np
+import engine
+from lru import LRUCache
+from store import SOLUTE_STORE, SOLVENT_STORE
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("SOLUBIX_CACHE_DIR", os.path.join(BASE_DIR, ".cache"))
+# Full RED rows for custom solutes are cached only for whole-library scans and
+# bounded by bytes, so large libraries do not multiply per-row memory
+CUSTOM_CACHE_BYTES = 64 * 1024 * 1024
+FULL_ROW_FRACTION = 0.5
+
+SOLUTE_NAMES = SOLUTE_STORE.names
+SOLUTE_INDEX = SOLUTE_STORE.index
+
+def data_hash():
+    """Hash of the loaded solvent and solute libraries, used to key the cache file"""
+    return hashlib.sha256(
+        (SOLVENT_STORE.digest() + SOLUTE_STORE.digest()).encode("ascii")).hexdigest()[:16]
+
+def cache_path(key):
+    return os.path.join(CACHE_DIR, f"red_matrix-{key}.npz")
+
+def build():
+    """Named solutes × solvents RED matrix as float32"""
+    return engine.red_matrix(SOLUTE_STORE.to_dict().values()).astype(np.float32)
+
+def load_or_build():
+    """Load the RED matrix for the current libraries, rebuilding it if missing or stale"""
+    key = data_hash()
+    path = cache_path(key)
+    try:
+        with np.load(path, allow_pickle=False) as cached:
+            if (cached["solutes"].tolist() == SOLUTE_NAMES
+                    and cached["solvents"].tolist() == engine.SOLVENT_NAMES):
+                logger.info("Loaded RED matrix cache %s", path)
+                return cached["red"]
+            logger.warning("RED matrix cache %s does not match the data, rebuilding", path)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        pass
+
+    red = build()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write under a temporary name so concurrent workers never read a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, red=red, solutes=np.array(SOLUTE_NAMES),
+                     solvents=np.array(engine.SOLVENT_NAMES))
+        os.replace(tmp_path, path)
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith("red_matrix-") and name != os.path.basename(path):
+                os.remove(os.path.join(CACHE_DIR, name))
+        logger.info("Built RED matrix cache %s", path)
+    except OSError as e:
+        logger.warning("Could not write RED matrix cache: %s", str(e))
+    return red
+
+RED_MATRIX = load_or_build()
+RED_MATRIX.flags.writeable = False
+
+custom_rows = LRUCache(max(1, CUSTOM_CACHE_BYTES // (8 * max(1, len(engine.SOLVENT_NAMES)))))
+
+def red_values(solute, indices, solute_name=None):
+    """RED of a solute for the given solvent rows
+
+    Named solutes read the precomputed matrix. Custom solutes use a cached full
+    row when there is one; otherwise only the requested rows are computed, and
+    a full row is built and cached when the request covers most of the library.
+    """
+    idx = SOLUTE_INDEX.get(solute_name)
+    if idx is not None:
+        return RED_MATRIX[idx, indices].astype(np.float64)
+    key = (solute["d"], solute["p"], solute["h"], solute["ro"])
+    row = custom_rows.get(key)
+    if row is None and len(indices) >= FULL_ROW_FRACTION * len(engine.SOLVENT_NAMES):
+        row = engine.red_matrix([solute])[0]
+        row.flags.writeable = False
+        custom_rows.put(key, row)
+    if row is not None:
+        return row[indices]
+    points = engine.SOLVENT_MATRIX[indices]
+    return engine.hsp_distance((solute["d"], solute["p"], solute["h"]), points) / solute["ro"]
@@ -0,0 +1,146 @@
+import bisect
+import re
+from collections import Counter, defaultdict
+import numpy as np
+
+WORD_RE = re.compile(r"\w+")
+SYNONYM_RE = re.compile(r"\(([^)]*)\)")
+
+def trigrams(text):
+    """Padded character trigrams, so word starts and ends carry weight"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def edit_distance(a, b, limit):
+    """Damerau-Levenshtein (optimal string alignment) distance, capped at limit + 1"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                             previous[j - 1] + (ca != cb))
+            if (previous2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+class SearchIndex:
+    """Prebuilt name index with ranked exact, prefix, substring and typo-tolerant matching
+
+    Synonyms are taken from parentheses in the names, so "DCM" finds
+    "Dichloromethane (DCM)".
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.lower = [name.lower() for name in self.names]
+        self.exact = defaultdict(set)
+        self.words = [set() for _ in self.names]
+        heads, words = [], []
+        self.grams = defaultdict(set)
+
+        for i, name in enumerate(self.lower):
+            keys = {name, SYNONYM_RE.sub("", name).strip()}
+            keys.update(s.strip() for s in SYNONYM_RE.findall(name))
+            keys.discard("")
+            for key in keys:
+                self.exact[key].add(i)
+                heads.append((key, i))
+            self.words[i] = set(WORD_RE.findall(name)) | keys
+            words.extend((word, i) for word in WORD_RE.findall(name))
+            for gram in trigrams(name):
+                self.grams[gram].add(i)
+
+        # Rank every name once by (length, name), the order results are shown in
+        self.order = np.array(sorted(range(len(self.names)),
+                                     key=lambda i: (len(self.names[i]), self.lower[i])),
+                              dtype=np.int64)
+        self.rank = np.empty(len(self.names), dtype=np.int64)
+        self.rank[self.order] = np.arange(len(self.names))
+        self.heads = self._ranked_keys(heads)
+        self.word_list = self._ranked_keys(words)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _ranked_keys(self, entries):
+        """Sorted keys with the rank of each key's name alongside"""
+        entries = sorted(entries)
+        return ([key for key, _ in entries],
+                np.array([self.rank[i] for _, i in entries], dtype=np.int64))
+
+    def _prefixed(self, entries, query, count):
+        """Best-ranked count names with a key starting with query, in rank order"""
+        keys, ranks = entries
+        start = bisect.bisect_left(keys, query)
+        end = bisect.bisect_left(keys, query + "\U0010ffff", start)
+        window = ranks[start:end]
+        # A name can match through several keys, so widen until count distinct ranks are found
+        k = count
+        while True:
+            if k >= len(window):
+                best = np.unique(window)
+                break
+            best = np.unique(np.partition(window, k)[:k])
+            if len(best) >= count:
+                break
+            k *= 2
+        return self.order[best[:count]].tolist()
+
+    def _substring(self, query):
+        if len(query) < 3:
+            return {i for i, name in enumerate(self.lower) if query in name}
+        # Every trigram of the query must appear in the name; verify the survivors
+        grams = [query[i:i + 3] for i in range(len(query) - 2)]
+        postings = sorted((self.grams.get(g, set()) for g in grams), key=len)
+        candidates = set.intersection(*postings)
+        return {i for i in candidates if query in self.lower[i]}
+
+    def _fuzzy(self, query, limit):
+        max_edits = 1 if len(query) <= 5 else 2 if len(query) <= 10 else 3
+        query_grams = trigrams(query)
+        overlap = Counter()
+        for gram in query_grams:
+            overlap.update(self.grams.get(gram, ()))
+        needed = max(1, len(query_grams) // 3)
+
+        scored = []
+        for i, shared in overlap.most_common(limit * 10):
+            if shared < needed:
+                break
+            # Compare against whole keys and words, and against their typed-so-far prefix
+            distance = min(min(edit_distance(query, key, max_edits),
+                               edit_distance(query, key[:len(query)], max_edits))
+                           for key in self.words[i])
+            if distance <= max_edits:
+                scored.append((distance, -shared, len(self.names[i]), i))
+        return [i for *_, i in sorted(scored)]
+
+    def search(self, query, limit=20):
+        """Names ranked exact > name/synonym prefix > word prefix > substring, else fuzzy"""
+        query = query.lower().strip()
+        if not query:
+            return self.names[:limit]
+
+        ranked, seen = [], set()
+        by_rank = lambda found: sorted(found, key=self.rank.__getitem__)
+        tiers = (lambda: by_rank(self.exact.get(query, ())),
+                 lambda: self._prefixed(self.heads, query, limit + len(ranked)),
+                 lambda: self._prefixed(self.word_list, query, limit + len(ranked)),
+                 lambda: by_rank(self._substring(query)))
+        for tier in tiers:
+            if len(ranked) >= limit:
+                break
+            for i in tier():
+                if i not in seen:
+                    ranked.append(i)
+                    seen.add(i)
+        # Typo tolerance only kicks in when nothing matches literally
+        if not ranked and len(query) >= 3:
+            ranked = self._fuzzy(query, limit)
+        return [self.names[i] for i in ranked[:limit]]
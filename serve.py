@@ -0,0 +1,112 @@
+"""Production entry point: python serve.py [--bind HOST:PORT] [--workers N] [--threads N]
+
+python serve.py --import-profile reports cold-start cost instead of serving.
+"""
+import argparse
+import gc
+import logging
+import os
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Seconds for a fresh interpreter to import the app (excluding warm-up)
+COLD_START_TARGET = float(os.environ.get("SOLUBIX_COLD_START_TARGET", 0.25))
+PROFILE_SCRIPT = """
+import time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.warm_up()
+print(imported - start, time.perf_counter() - imported)
+"""
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run Solubix under a multi-worker WSGI server")
+    parser.add_argument("--bind", default=os.environ.get("SOLUBIX_BIND", "0.0.0.0:8000"))
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("SOLUBIX_WORKERS", os.cpu_count() or 1)))
+    parser.add_argument("--threads", type=int,
+                        default=int(os.environ.get("SOLUBIX_THREADS", 4)))
+    parser.add_argument("--timeout", type=int,
+                        default=int(os.environ.get("SOLUBIX_TIMEOUT", 60)))
+    parser.add_argument("--import-profile", action="store_true",
+                        help="report import and warm-up time of a cold process, then exit")
+    return parser.parse_args()
+
+def import_profile(top=12):
+    """Print the slowest imports of a fresh interpreter and the cold-start time vs the target"""
+    env = dict(os.environ, SOLUBIX_LOG_LEVEL="WARNING")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROFILE_SCRIPT],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+                            capture_output=True, text=True, check=True)
+    import_s, warm_up_s = map(float, result.stdout.split())
+
+    # importtime lines: "import time: self_us | cumulative_us | <indent>module",
+    # children listed before their parent; keep the direct children of app
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 0:
+            if name.strip() == "app":
+                break
+            modules = []
+        elif depth == 1:
+            modules.append((int(cumulative) / 1e6, name.strip()))
+
+    print(f"{'module':<24} {'import ms':>10}")
+    for seconds, name in sorted(modules, reverse=True)[:top]:
+        print(f"{name:<24} {seconds * 1000:>10.1f}")
+    print(f"\nimport app: {import_s * 1000:.0f} ms (target {COLD_START_TARGET * 1000:.0f} ms)")
+    print(f"warm_up():  {warm_up_s * 1000:.0f} ms (runs once in the master before workers fork)")
+    return 0 if import_s <= COLD_START_TARGET else 1
+
+def main():
+    args = parse_args()
+    if args.import_profile:
+        sys.exit(import_profile())
+
+    from app import app, warm_up
+    import heavy
+
+    # Keep heavy work from tying up every gthread thread of a worker
+    admitted = heavy.configure(args.threads)
+    logger.info("Admitting at most %d heavy tasks per worker", admitted)
+
+    # Everything built at import (solvent arrays, RED matrix, search and spatial
+    # indexes) plus the lazy plot reference is created here, in the master, so
+    # forked workers share those pages copy-on-write. Freezing the GC keeps
+    # collections in the workers from touching (and so copying) them.
+    warm_up()
+    gc.freeze()
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        logger.warning("gunicorn is not installed; falling back to a single-process threaded server")
+        host, _, port = args.bind.rpartition(":")
+        app.run(host=host or "0.0.0.0", port=int(port), threaded=True)
+        return
+
+    class SolubixApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", args.bind)
+            self.cfg.set("workers", args.workers)
+            self.cfg.set("threads", args.threads)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("timeout", args.timeout)
+            self.cfg.set("preload_app", True)
+            self.cfg.set("loglevel", os.environ.get("SOLUBIX_LOG_LEVEL", "info").lower())
+
+        def load(self):
+            return app
+
+    logger.info("Starting %d workers × %d threads on %s", args.workers, args.threads, args.bind)
+    SolubixApplication().run()
+
+if __name__ == "__main__":
+    main()
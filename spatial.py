@@ -0,0 +1,89 @@
+import numpy as np
+import engine
+
+class GridIndex:
+    """Uniform grid over scaled (2δD, δP, δH) coordinates for radius and k-nearest queries
+
+    Points are bucketed by cell and stored sorted by cell key, so a query only
+    touches the cells overlapping its search ball instead of the whole library.
+    """
+
+    def __init__(self, points, per_cell=4):
+        self.points = engine.scaled(points).reshape(-1, 3)
+        n = len(self.points)
+        self.low = self.points.min(axis=0) if n else np.zeros(3)
+        self.high = self.points.max(axis=0) if n else np.ones(3)
+        span = self.high - self.low
+        # Size cells so an average occupied cell holds roughly per_cell points
+        volume = np.prod(np.maximum(span, 1.0))
+        self.cell = max(float(np.cbrt(volume * per_cell / max(n, 1))), 0.5)
+        self.shape = np.floor(span / self.cell).astype(np.int64) + 1
+
+        keys = self._keys(self._cells(self.points))
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def __len__(self):
+        return len(self.points)
+
+    def _cells(self, points):
+        return np.floor((points - self.low) / self.cell).astype(np.int64)
+
+    def _keys(self, cells):
+        return np.ravel_multi_index(cells.T, self.shape)
+
+    def _candidates(self, center, radius):
+        """Indices of points in cells overlapping the ball, or all points if that is cheaper"""
+        if not np.all(np.isfinite(center)):
+            return np.empty(0, dtype=np.intp)
+        # Cell ranges stay floats until clipped, so huge or infinite radii cannot overflow int64
+        first = np.floor((center - radius - self.low) / self.cell)
+        last = np.floor((center + radius - self.low) / self.cell)
+        if np.any(last < 0) or np.any(first > self.shape - 1):
+            return np.empty(0, dtype=np.intp)
+        first = np.maximum(first, 0).astype(np.int64)
+        last = np.minimum(last, self.shape - 1).astype(np.int64)
+        if np.prod(last - first + 1) >= len(self.points):
+            return np.arange(len(self.points))
+
+        axes = [np.arange(first[i], last[i] + 1) for i in range(3)]
+        cells = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+        keys = self._keys(cells)
+        starts = np.searchsorted(self.keys, keys, side="left")
+        ends = np.searchsorted(self.keys, keys, side="right")
+        counts = ends - starts
+        if not counts.sum():
+            return np.empty(0, dtype=np.intp)
+        # Expand each [start, end) run into positions without a Python loop
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return self.order[np.repeat(starts, counts) + offsets]
+
+    def within(self, center, radius):
+        """(indices, distances) of points within Hansen distance radius, nearest first"""
+        x = engine.scaled(center)
+        idx = self._candidates(x, radius)
+        with np.errstate(over="ignore"):
+            dist = np.linalg.norm(self.points[idx] - x, axis=1)
+        keep = dist <= radius
+        idx, dist = idx[keep], dist[keep]
+        order = np.argsort(dist, kind="stable")
+        return idx[order], dist[order]
+
+    def nearest(self, center, k):
+        """(indices, distances) of the k nearest points, growing the search ball as needed"""
+        k = min(k, len(self.points))
+        x = engine.scaled(center)
+        if k <= 0 or not np.all(np.isfinite(x)):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        # A ball reaching the farthest bounding-box corner holds every point
+        with np.errstate(over="ignore"):
+            far = np.linalg.norm(np.maximum(np.abs(x - self.low), np.abs(x - self.high)))
+        radius = self.cell
+        while radius < far:
+            idx, dist = self.within(center, radius)
+            # Every point within radius was found, so the k closest of them are exact
+            if len(idx) >= k:
+                return idx[:k], dist[:k]
+            radius *= 2
+        idx, dist = self.within(center, np.inf)
+        return idx[:k], dist[:k]
@@ -5,6 +5,8 @@ document.addEventListener('DOMContentLoaded', () => {
     let systemSolvents = new Set();
     let solutes = {};
     let solvents = {};
+    // Last result set, so selection/temperature changes can be sent as deltas
+    let session = null;
 
     // DOM Elements
     const elements = {
@@ -14,6 +16,7 @@ document.addEventListener('DOMContentLoaded', () => {
         soluteP: document.getElementById("solute-p"),
         soluteH: document.getElementById("solute-h"),
         soluteRo: document.getElementById("solute-ro"),
+        temperature: document.getElementById("temperature"),
         solventSearch: document.getElementById("solvent-search"),
         searchResults: document.getElementById("search-results"),
         calculateBtn: document.getElementById("calculate"),
@@ -131,14 +134,28 @@ document.addEventListener('DOMContentLoaded', () => {
             solute_p: elements.soluteP.value,
             solute_h: elements.soluteH.value,
             solute_ro: elements.soluteRo.value,
+            temperature: elements.temperature.value,
+            plot_format: 'compact',
             solvents: Array.from(elements.solventSelect.selectedOptions).map(opt => opt.value)
         };
 
         if (!validateInputs(params)) return;
 
-        showLoading();
+        // Name a database solute when its values are unedited, so the server
+        // can use its precomputed RED row
+        const soluteOption = elements.soluteSelect.options[elements.soluteSelect.selectedIndex];
+        if (soluteOption && soluteOption.value &&
+                ['d', 'p', 'h', 'ro'].every(k => Number(soluteOption.dataset[k]) === Number(params[`solute_${k}`]))) {
+            params.solute_name = soluteOption.value;
+        }
+
+        const soluteKey = [params.solute_d, params.solute_p, params.solute_h, params.solute_ro].join();
+        const incremental = session !== null && session.soluteKey === soluteKey;
+        showLoading(!incremental);
 
         try {
+            if (incremental && await updateSolubility(params)) return;
+
             const response = await fetch('/api/calculate', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
@@ -149,13 +166,56 @@ document.addEventListener('DOMContentLoaded', () => {
             
             const data = await response.json();
             handleCalculationResponse(data);
+            session = data.token ? { token: data.token, soluteKey, results: data.results } : null;
         } catch (error) {
+            session = null;
             handleCalculationError(error);
         } finally {
             hideLoading();
         }
     }
 
+    // Send only added/removed solvents and the temperature; false if the
+    // server no longer has the session and a full request is needed
+    async function updateSolubility(params) {
+        const selected = new Set(params.solvents);
+        const previous = Object.keys(session.results);
+        const response = await fetch('/api/calculate_update', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                token: session.token,
+                temperature: params.temperature,
+                add_solvents: params.solvents.filter(name => !(name in session.results)),
+                remove_solvents: previous.filter(name => !selected.has(name))
+            })
+        });
+        if (response.status === 404) {
+            session = null;
+            elements.plotContainer.innerHTML = '';
+            return false;
+        }
+        if (!response.ok) throw new Error('Calculation failed');
+
+        const data = await response.json();
+        data.removed.forEach(name => delete session.results[name]);
+        // Added rows arrive whole; kept rows may carry only changed columns
+        Object.entries(data.results).forEach(([name, row]) => {
+            session.results[name] = { ...session.results[name], ...row };
+        });
+        session.token = data.token;
+
+        if (data.plot_update) {
+            updatePlotPoints(data.plot_update);
+        } else if (data.plot_json) {
+            const plotData = JSON.parse(data.plot_json);
+            Plotly.react(elements.plotContainer, plotData.data, plotData.layout);
+        }
+        updateResultsTable(session.results);
+        updateLastUpdated();
+        return true;
+    }
+
     // Helper functions
     function validateInputs(params) {
         if (!params.solute_d || !params.solute_p || !params.solute_h || !params.solute_ro) {
@@ -175,19 +235,92 @@ document.addEventListener('DOMContentLoaded', () => {
             return;
         }
 
-        if (data.plot_json) {
-            try {
+        try {
+            if (data.plot_data) {
+                const plot = buildPlot(data.plot_data);
+                Plotly.newPlot(elements.plotContainer, plot.data, plot.layout);
+            } else if (data.plot_json) {
                 const plotData = JSON.parse(data.plot_json);
                 Plotly.newPlot(elements.plotContainer, plotData.data, plotData.layout);
-            } catch (error) {
-                console.error('Plot error:', error);
             }
+        } catch (error) {
+            console.error('Plot error:', error);
         }
 
         updateResultsTable(data.results);
         updateLastUpdated();
     }
 
+    // 3D plot from the compact payload (same traces as the server-side figure)
+    const hsp = (d, p, h) => `δD=${d.toFixed(1)}, δP=${p.toFixed(1)}, δH=${h.toFixed(1)}`;
+
+    function sphereMesh(solute, uSteps = 20, vSteps = 10) {
+        const x = [], y = [], z = [];
+        for (let i = 0; i < uSteps; i++) {
+            const u = 2 * Math.PI * i / (uSteps - 1);
+            const rowX = [], rowY = [], rowZ = [];
+            for (let j = 0; j < vSteps; j++) {
+                const v = Math.PI * j / (vSteps - 1);
+                rowX.push(solute.ro * Math.cos(u) * Math.sin(v) + solute.d);
+                rowY.push(solute.ro * Math.sin(u) * Math.sin(v) + solute.p);
+                rowZ.push(solute.ro * Math.cos(v) + solute.h);
+            }
+            x.push(rowX); y.push(rowY); z.push(rowZ);
+        }
+        return { x, y, z };
+    }
+
+    // Replace the solvent points trace, leaving the solute and sphere traces as they are
+    function updatePlotPoints(points) {
+        const { solvents: names, d_values: d, p_values: p, h_values: h } = points;
+        Plotly.restyle(elements.plotContainer, {
+            x: [d], y: [p], z: [h],
+            text: [names],
+            hovertext: [names.map((name, i) => `${name}: ${hsp(d[i], p[i], h[i])}`)],
+            'marker.color': [points.status.map(code => points.status_colors[code])]
+        }, [0]);
+    }
+
+    function buildPlot(plotData) {
+        const { solvents: names, d_values: d, p_values: p, h_values: h, solute } = plotData;
+        const data = [{
+            type: 'scatter3d',
+            mode: 'markers+text',
+            name: 'Solvents',
+            x: d, y: p, z: h,
+            text: names,
+            hovertext: names.map((name, i) => `${name}: ${hsp(d[i], p[i], h[i])}`),
+            marker: { size: 10, color: plotData.status.map(code => plotData.status_colors[code]) }
+        }, {
+            type: 'scatter3d',
+            mode: 'markers+text',
+            name: 'Solute',
+            x: [solute.d], y: [solute.p], z: [solute.h],
+            text: ['Solute'],
+            hovertext: `Solute: ${hsp(solute.d, solute.p, solute.h)}`,
+            marker: { size: 14, color: 'blue', symbol: 'diamond' }
+        }, {
+            type: 'surface',
+            name: 'Solubility Sphere',
+            ...sphereMesh(solute),
+            opacity: 0.2,
+            colorscale: [[0, 'blue'], [1, 'blue']],
+            showscale: false
+        }];
+        const layout = {
+            scene: {
+                xaxis: { title: { text: 'δD (Dispersion)' } },
+                yaxis: { title: { text: 'δP (Polar)' } },
+                zaxis: { title: { text: 'δH (Hydrogen Bonding)' } },
+                aspectmode: 'cube',
+                camera: { eye: { x: 1.5, y: 1.5, z: 1.2 } }
+            },
+            margin: { l: 0, r: 0, b: 0, t: 30 },
+            height: 600
+        };
+        return { data, layout };
+    }
+
     function handleCalculationError(error) {
         console.error('Calculation error:', error);
         showMessage('Failed to calculate. Please try again.');
@@ -221,11 +354,13 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    function showLoading() {
-        elements.resultsTable.innerHTML = '';
+    function showLoading(clearPlot = true) {
         elements.message.style.display = 'none';
         elements.loading.style.display = 'block';
-        elements.plotContainer.innerHTML = '';
+        if (clearPlot) {
+            elements.resultsTable.innerHTML = '';
+            elements.plotContainer.innerHTML = '';
+        }
     }
 
     function hideLoading() {
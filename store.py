@@ -0,0 +1,219 @@
+import csv
+import gzip
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import numpy as np
+
+SOLVENT_COLUMNS = ("d", "p", "h")
+SOLUTE_COLUMNS = ("d", "p", "h", "ro")
+# Per-entry values that may be missing (stored as NaN), e.g. thermal expansion "alpha"
+OPTIONAL_COLUMNS = ("alpha",)
+
+# Binary library (.hspb): magic, uint32 header length, JSON header, then
+# 64-byte aligned blocks: little-endian float64 values (rows × columns), one
+# float64 block per optional column, and a NUL-separated UTF-8 name table.
+BINARY_MAGIC = b"HSPLIB01"
+BINARY_ALIGN = 64
+BINARY_DTYPE = "<f8"
+
+class HSPStore:
+    """Columnar HSP library: a names list, an N×k float array and a name→row index"""
+
+    def __init__(self, names, values, columns, extras=None):
+        self.names = list(names)
+        self.values = np.ascontiguousarray(values, dtype=np.float64).reshape(-1, len(columns))
+        self.columns = tuple(columns)
+        self.extras = {k: np.asarray(v, dtype=np.float64) for k, v in (extras or {}).items()}
+        if len(self.names) != len(self.values):
+            raise ValueError("Names and values must have the same length")
+        if any(len(v) != len(self.names) for v in self.extras.values()):
+            raise ValueError("Optional columns must have one value per entry")
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.values.flags.writeable = False
+
+    @classmethod
+    def from_dict(cls, mapping, columns):
+        """Build from a {name: {column: value}} dict such as data.solvents.SOLVENTS"""
+        values = [[entry[c] for c in columns] for entry in mapping.values()]
+        extras = {c: [entry.get(c, np.nan) for entry in mapping.values()]
+                  for c in OPTIONAL_COLUMNS
+                  if any(c in entry for entry in mapping.values())}
+        return cls(mapping.keys(), values, columns, extras)
+
+    @classmethod
+    def from_csv(cls, path, columns):
+        """Build from a CSV file with a name column followed by the HSP columns"""
+        names, values = [], []
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            extras = {c: [] for c in OPTIONAL_COLUMNS if c in (reader.fieldnames or ())}
+            for row in reader:
+                try:
+                    values.append([float(row[c]) for c in columns])
+                    for c, column in extras.items():
+                        column.append(float(row[c]) if row[c] else np.nan)
+                except (KeyError, TypeError, ValueError) as e:
+                    raise ValueError(f"Invalid row in {path}: {row} ({e})")
+                names.append(row["name"])
+        return cls(names, values, columns, extras)
+
+    @classmethod
+    def from_npz(cls, path):
+        """Build from a file written by save_npz()"""
+        with np.load(path, allow_pickle=False) as f:
+            extras = {k[len("extra_"):]: f[k] for k in f.files if k.startswith("extra_")}
+            return cls(f["names"].tolist(), f["values"], f["columns"].tolist(), extras)
+
+    @classmethod
+    def from_binary(cls, path):
+        """Memory-map a file written by save_binary(); numeric columns are not copied"""
+        with open(path, "rb") as f:
+            if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+                raise ValueError(f"{path} is not a binary HSP library")
+            (length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(length))
+            offset, size = header["blocks"]["names"]
+            f.seek(offset)
+            names = f.read(size).decode("utf-8").split("\0") if header["rows"] else []
+
+        rows, columns = header["rows"], header["columns"]
+        def block(name, shape):
+            offset, size = header["blocks"][name]
+            if not size:
+                return np.empty(shape, dtype=BINARY_DTYPE)
+            return np.memmap(path, dtype=BINARY_DTYPE, mode="r", offset=offset, shape=shape)
+
+        extras = {c: block(f"extra_{c}", (rows,)) for c in header["extras"]}
+        return cls(names, block("values", (rows, len(columns))), columns, extras)
+
+    def save_npz(self, path):
+        extras = {f"extra_{k}": v for k, v in self.extras.items()}
+        np.savez(path, names=np.array(self.names), values=self.values,
+                 columns=np.array(self.columns), **extras)
+
+    def save_binary(self, path):
+        """Write the memory-mappable binary format, replacing path atomically"""
+        if any("\0" in name for name in self.names):
+            raise ValueError("Names must not contain NUL characters")
+        payloads = {"values": self.values.astype(BINARY_DTYPE).tobytes()}
+        payloads.update((f"extra_{c}", v.astype(BINARY_DTYPE).tobytes())
+                        for c, v in self.extras.items())
+        payloads["names"] = "\0".join(self.names).encode("utf-8")
+
+        def layout(start):
+            blocks, offset = {}, start
+            for name, payload in payloads.items():
+                offset = -(-offset // BINARY_ALIGN) * BINARY_ALIGN
+                blocks[name] = [offset, len(payload)]
+                offset += len(payload)
+            return blocks
+
+        # Offsets depend on the header length, which depends on the offsets
+        start = 0
+        while True:
+            blocks = layout(start)
+            header = json.dumps({"version": 1, "rows": len(self.names), "columns": self.columns,
+                                 "extras": sorted(self.extras), "blocks": blocks}).encode("utf-8")
+            end = len(BINARY_MAGIC) + 4 + len(header)
+            if end <= start:
+                break
+            start = end
+
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(BINARY_MAGIC + struct.pack("<I", len(header)) + header)
+                for name, payload in payloads.items():
+                    f.write(b"\0" * (blocks[name][0] - f.tell()))
+                    f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def row(self, name):
+        """Entry for one name as a {column: value} dict; KeyError if unknown"""
+        i = self.index[name]
+        entry = dict(zip(self.columns, self.values[i].tolist()))
+        for c, column in self.extras.items():
+            if not np.isnan(column[i]):
+                entry[c] = float(column[i])
+        return entry
+
+    def to_dict(self):
+        entries = {name: dict(zip(self.columns, row))
+                   for name, row in zip(self.names, self.values.tolist())}
+        for c, column in self.extras.items():
+            for i in np.flatnonzero(~np.isnan(column)).tolist():
+                entries[self.names[i]][c] = float(column[i])
+        return entries
+
+    def extra(self, column, default):
+        """Optional column as a full array, with missing entries set to default"""
+        values = self.extras.get(column)
+        if values is None:
+            return np.full(len(self.names), default, dtype=np.float64)
+        return np.where(np.isnan(values), default, values)
+
+    def digest(self):
+        """Content hash of names and values, for cache keys"""
+        h = hashlib.sha256()
+        h.update("\0".join(self.names).encode("utf-8"))
+        h.update(",".join(self.columns).encode("utf-8"))
+        h.update(self.values.tobytes())
+        for c in sorted(self.extras):
+            h.update(c.encode("utf-8"))
+            h.update(self.extras[c].tobytes())
+        return h.hexdigest()[:16]
+
+class JSONPayload:
+    """Pre-serialized JSON body with its gzip encoding and ETag"""
+
+    def __init__(self, obj):
+        self.body = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        self.gzip_body = gzip.compress(self.body, mtime=0)
+        self.etag = hashlib.sha1(self.body).hexdigest()
+
+def load(path, columns):
+    """Load a library from a .csv, .npz or binary .hspb file"""
+    if path.endswith(".csv"):
+        return HSPStore.from_csv(path, columns)
+    if path.endswith(".npz"):
+        store = HSPStore.from_npz(path)
+        if store.columns != tuple(columns):
+            raise ValueError(f"{path} has columns {store.columns}, expected {tuple(columns)}")
+        return store
+    if path.endswith(".hspb"):
+        store = HSPStore.from_binary(path)
+        if store.columns != tuple(columns):
+            raise ValueError(f"{path} has columns {store.columns}, expected {tuple(columns)}")
+        return store
+    raise ValueError(f"Unsupported library format: {path}")
+
+def load_solvents():
+    """Solvent library from SOLUBIX_SOLVENTS_FILE, or the bundled data module"""
+    path = os.environ.get("SOLUBIX_SOLVENTS_FILE")
+    if path:
+        return load(path, SOLVENT_COLUMNS)
+    from data.solvents import SOLVENTS
+    return HSPStore.from_dict(SOLVENTS, SOLVENT_COLUMNS)
+
+def load_solutes():
+    """Solute library from SOLUBIX_SOLUTES_FILE, or the bundled data module"""
+    path = os.environ.get("SOLUBIX_SOLUTES_FILE")
+    if path:
+        return load(path, SOLUTE_COLUMNS)
+    from data.solutes import SOLUTES
+    return HSPStore.from_dict(SOLUTES, SOLUTE_COLUMNS)
+
+SOLVENT_STORE = load_solvents()
+SOLUTE_STORE = load_solutes()
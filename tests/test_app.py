@@ -0,0 +1,49 @@
+import gzip
+import json
+
+import pytest
+
+import app
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+@pytest.mark.parametrize("accept, gzipped", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("*", True),
+    ("", False),
+    ("identity", False),
+    ("gzip;q=0", False),
+    ("identity, *;q=0", False),
+])
+def test_database_payload_honours_accept_encoding(client, accept, gzipped):
+    response = client.get("/api/SOLVENTS", headers={"Accept-Encoding": accept})
+    assert response.status_code == 200
+    assert (response.headers.get("Content-Encoding") == "gzip") == gzipped
+    body = response.get_data()
+    assert json.loads(gzip.decompress(body) if gzipped else body)
+
+def test_unchanged_payload_is_a_304(client):
+    etag = client.get("/api/SOLUTES").headers["ETag"]
+    response = client.get("/api/SOLUTES", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+@pytest.mark.parametrize("route, body", [
+    ("/api/calculate_batch", {"solutes": [5]}),
+    ("/api/calculate_batch", {"solutes": [None]}),
+    ("/api/calculate_batch", {"solutes": [{"name": ["x"], "d": 1, "p": 1, "h": 1, "ro": 1}]}),
+    ("/api/calculate_batch", {"solutes": 5}),
+    ("/api/calculate_batch", {"solutes": [{"d": "nan", "p": 1, "h": 1, "ro": 1}]}),
+    ("/api/export", {"solutes": [[18, 8, 9, 5]]}),
+    ("/api/rank_solvents", {"solute_name": "Curcumin", "reject": [5]}),
+])
+def test_malformed_batch_solutes_are_rejected(client, route, body):
+    assert client.post(route, json=body).status_code == 400
+
+def test_batch_accepts_names_and_objects(client):
+    body = {"solutes": ["Curcumin", {"name": "custom", "d": 18, "p": 8, "h": 9, "ro": 5}]}
+    data = client.post("/api/calculate_batch", json=body).get_json()
+    assert data["solutes"] == ["Curcumin", "custom"]
+    assert len(data["red"][0]) == len(data["solvents"])
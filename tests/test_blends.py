@@ -0,0 +1,52 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import blends
+import engine
+
+def brute_force(solute, indices, units, top_k):
+    """Best grid distance of every pair and triple, smallest top_k"""
+    x = engine.scaled([solute["d"], solute["p"], solute["h"]])
+    points = engine.scaled(engine.SOLVENT_MATRIX[indices])
+    best = []
+    for size in (2, 3):
+        fractions = blends.composition_grid(units, size)
+        for combo in itertools.combinations(range(len(points)), size):
+            mixed = fractions @ points[list(combo)]
+            best.append(np.linalg.norm(mixed - x, axis=1).min())
+    return sorted(best)[:top_k]
+
+@pytest.mark.parametrize("seed", range(8))
+def test_pruned_search_matches_brute_force(monkeypatch, seed):
+    # Small chunks so the lower-bound early exit is exercised, not just the pruning
+    monkeypatch.setattr(blends, "EVAL_CHUNK", 32)
+    rng = np.random.default_rng(seed)
+    indices = rng.choice(len(engine.SOLVENT_MATRIX), 25, replace=False)
+    solute = dict(zip("dph", rng.uniform([14, 0, 0], [21, 20, 25]).tolist()), ro=5.0)
+    found = blends.search_blends(solute, indices, step=0.1, top_k=10, ternary=True)["blends"]
+    expected = brute_force(solute, indices, 10, 10)
+    assert np.allclose([b["ra"] for b in found], expected, atol=0.006)
+
+def test_fractions_sum_to_one():
+    for size, units in ((2, 20), (3, 10)):
+        grid = blends.composition_grid(units, size)
+        assert np.allclose(grid.sum(axis=1), 1)
+        assert grid.min() > 0
+
+@pytest.mark.parametrize("step", [0, -0.1, 0.6, 0.001, 0.3, float("nan")])
+def test_invalid_steps_are_rejected(step):
+    with pytest.raises(ValueError):
+        blends.search_blends({"d": 17, "p": 9, "h": 8, "ro": 5}, [0, 1, 2], step=step)
+
+def test_chunks_stay_within_the_element_budget(monkeypatch):
+    sizes = []
+    original = blends.best_in_chunk
+    def record(x, points, combos, fractions):
+        sizes.append(len(combos) * len(fractions) * 3)
+        return original(x, points, combos, fractions)
+    monkeypatch.setattr(blends, "best_in_chunk", record)
+    blends.search_blends({"d": 17, "p": 9, "h": 8, "ro": 5}, np.arange(40), step=0.01,
+                         ternary=True)
+    assert max(sizes) <= blends.CHUNK_ELEMENTS
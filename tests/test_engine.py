@@ -0,0 +1,40 @@
+import json
+import math
+
+import numpy as np
+
+import engine
+
+def test_evaluate_matches_per_solvent_formula():
+    solute = {"d": 18.2, "p": 8.6, "h": 11.5, "ro": 5.5}
+    indices = np.arange(len(engine.SOLVENT_NAMES))
+    calc = engine.evaluate(solute, indices)
+    for i in range(0, len(indices), 7):
+        d, p, h = engine.SOLVENT_MATRIX[i]
+        ra = math.sqrt(4 * (solute["d"] - d) ** 2 + (solute["p"] - p) ** 2
+                       + (solute["h"] - h) ** 2)
+        red = ra / solute["ro"]
+        assert math.isclose(calc["ra"][i], ra)
+        assert math.isclose(calc["red"][i], red)
+        assert calc["codes"][i] == (0 if red <= 1 else 1 if red <= 1.5 else 2)
+    # At 25 °C the temperature model leaves RED unchanged
+    assert np.allclose(calc["temp_corrected"], 1 / calc["red"])
+
+def test_status_code_thresholds_are_inclusive():
+    assert engine.status_codes(np.array([0.0, 1.0, 1.2, 1.5, 1.6])).tolist() == [0, 0, 1, 1, 2]
+
+def test_solute_on_a_solvent_gives_null_not_infinity():
+    import app
+    d, p, h = engine.SOLVENT_MATRIX[engine.SOLVENT_INDEX["Acetone"]].tolist()
+    body = {"solute_d": d, "solute_p": p, "solute_h": h, "solute_ro": 5,
+            "solvents": ["Acetone", "Water"]}
+    client = app.app.test_client()
+    response = client.post("/api/calculate", json=body)
+    assert response.status_code == 200
+    data = json.loads(response.get_data(as_text=True), parse_constant=lambda c: 1 / 0)
+    assert data["results"]["Acetone"]["temp_corrected_solubility"] is None
+    assert data["results"]["Water"]["temp_corrected_solubility"] > 0
+
+    export = client.post("/api/export", json={**body, "curve_step": 1}).get_data(as_text=True)
+    rows = [json.loads(line, parse_constant=lambda c: 1 / 0) for line in export.splitlines()]
+    assert rows[1]["temp_corrected_solubility"] is None
@@ -0,0 +1,45 @@
+import math
+
+import numpy as np
+import pytest
+
+import estimation
+from data.groups import GROUPS
+
+def hoftyzer_van_krevelen(groups, planes=0):
+    """δD, δP, δH and V summed group by group"""
+    fd = sum(GROUPS[g]["fd"] * n for g, n in groups.items())
+    fp2 = sum(GROUPS[g]["fp"] ** 2 * n for g, n in groups.items())
+    eh = sum(GROUPS[g]["eh"] * n for g, n in groups.items())
+    v = sum(GROUPS[g]["v"] * n for g, n in groups.items())
+    factor = (1.0, 0.5, 0.25, 0.0)[min(planes, 3)]
+    return fd / v, factor * math.sqrt(fp2) / v, math.sqrt(eh / v), v
+
+def test_ethanol():
+    estimate = estimation.estimate({"-CH3": 1, "-CH2-": 1, "-OH": 1})
+    assert estimate["v"] == pytest.approx(59.6)
+    assert estimate["d"] == pytest.approx(900 / 59.6)
+    assert estimate["p"] == pytest.approx(500 / 59.6)
+    assert estimate["h"] == pytest.approx(math.sqrt(20000 / 59.6))
+
+def test_batch_matches_per_molecule_sums():
+    rng = np.random.default_rng(0)
+    names = list(GROUPS)
+    molecules = []
+    for _ in range(200):
+        chosen = rng.choice(names, int(rng.integers(1, 4)), replace=False)
+        groups = {g: int(rng.integers(1, 4)) for g in chosen}
+        groups["-CH3"] = groups.get("-CH3", 0) + 6  # keeps the molar volume positive
+        molecules.append({"groups": groups, "symmetry_planes": int(rng.integers(0, 5))})
+    batch = estimation.estimate_batch(molecules)
+    for row, molecule in zip(batch, molecules):
+        expected = hoftyzer_van_krevelen(molecule["groups"], molecule["symmetry_planes"])
+        assert np.allclose(row, expected)
+        single = estimation.estimate(molecule["groups"], molecule["symmetry_planes"])
+        assert np.allclose([single[k] for k in "dphv"], expected)
+
+@pytest.mark.parametrize("groups", [{}, {"-XYZ": 1}, {"-CH3": -1}, {"-CH3": 1.5},
+                                    {"-CH3": True}, {">C<": 1}, "-CH3"])
+def test_invalid_groups_are_rejected(groups):
+    with pytest.raises(ValueError):
+        estimation.estimate(groups)
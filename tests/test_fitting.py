@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import engine
+import fitting
+
+def test_best_radius_minimizes_the_loss():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n = int(rng.integers(2, 40))
+        ra = rng.uniform(0, 10, (3, n))
+        good = rng.random(n) < 0.5
+        good[0] = True
+        ro, loss = fitting.best_radius(ra, good)
+        for row, r, value in zip(ra, ro, loss):
+            # The loss is piecewise linear in Ro with kinks at the distances
+            candidates = [np.where(good, np.maximum(row - c, 0), np.maximum(c - row, 0)).sum()
+                          for c in row]
+            assert value == pytest.approx(min(candidates))
+            assert r in row
+
+def test_fit_recovers_a_separable_sphere():
+    center, ro = np.array([18.0, 9.0, 9.0]), 6.0
+    ra = engine.hsp_distance(center, engine.SOLVENT_MATRIX)
+    # Leave a margin around the boundary so the labels are separable
+    keep = (ra < ro * 0.9) | (ra > ro * 1.1)
+    points, good = engine.SOLVENT_MATRIX[keep], ra[keep] < ro
+    fit = fitting.fit_sphere(points, good)
+    assert fit["fit"] == 1.0
+    assert fit["good_inside"] == fit["good_total"]
+    assert fit["bad_outside"] == fit["bad_total"]
+    assert abs(fit["ro"] - ro) < ro * 0.2
+
+def test_fit_needs_two_distinct_good_points():
+    points = [[18.0, 8.0, 9.0], [18.0, 8.0, 9.0], [15.0, 0.0, 0.0]]
+    with pytest.raises(ValueError):
+        fitting.fit_sphere(points, [True, True, False])
+
+@pytest.mark.parametrize("points", [[5, 6], ["Water", "Acetone"], [{"name": "Water", "good": True}]])
+def test_fit_route_rejects_bad_points(points):
+    import app
+    response = app.app.test_client().post("/api/fit_sphere", json={"points": points})
+    assert response.status_code == 400
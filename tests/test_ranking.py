@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import engine
+import ranking
+
+def brute_force(objectives):
+    """Non-dominated mask by comparing every pair of rows"""
+    le = (objectives[:, None, :] <= objectives[None, :, :]).all(axis=2)
+    lt = (objectives[:, None, :] < objectives[None, :, :]).any(axis=2)
+    return ~(le & lt).any(axis=0)
+
+@pytest.mark.parametrize("k", [1, 2, 3])
+def test_pareto_front_matches_brute_force(k):
+    rng = np.random.default_rng(k)
+    for _ in range(200):
+        # Small integer objectives give plenty of ties and duplicate rows
+        objectives = rng.integers(0, 6, (int(rng.integers(1, 60)), k)).astype(float)
+        assert np.array_equal(ranking.pareto_front(objectives), brute_force(objectives))
+
+def test_pareto_front_continuous_objectives():
+    rng = np.random.default_rng(0)
+    objectives = rng.normal(size=(500, 3))
+    assert np.array_equal(ranking.pareto_front(objectives), brute_force(objectives))
+
+def test_pareto_front_edge_cases():
+    assert ranking.pareto_front(np.empty((0, 2))).tolist() == []
+    assert ranking.pareto_front([[1.0, 2.0], [1.0, 2.0]]).tolist() == [True, True]
+    with pytest.raises(ValueError):
+        ranking.pareto_front(np.zeros((3, 4)))
+
+def test_carrier_distances_match_engine():
+    water = engine.SOLVENT_INDEX["Water"]
+    expected = engine.hsp_distance(engine.SOLVENT_MATRIX[water], engine.SOLVENT_MATRIX)
+    assert np.allclose(ranking.carrier_distances(water), expected)
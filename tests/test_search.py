@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+import engine
+import search
+
+def osa_distance(a, b):
+    """Unbounded optimal string alignment distance, straight from the recurrence"""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+def test_edit_distance_matches_recurrence():
+    rng = random.Random(0)
+    for _ in range(500):
+        a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 7)))
+        b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 7)))
+        limit = rng.randint(0, 3)
+        assert search.edit_distance(a, b, limit) == min(osa_distance(a, b), limit + 1)
+
+def naive_search(names):
+    """Search function with literal tiers found by scanning every name"""
+    lower = [n.lower() for n in names]
+    keys = [set(search.SearchIndex([n]).exact) for n in names]
+    words = [search.WORD_RE.findall(n) for n in lower]
+
+    def run(query, limit):
+        query = query.lower().strip()
+        if not query:
+            return names[:limit]
+        tiers = [
+            [i for i, k in enumerate(keys) if query in k],
+            [i for i, k in enumerate(keys) if any(key.startswith(query) for key in k)],
+            [i for i, w in enumerate(words) if any(word.startswith(query) for word in w)],
+            [i for i, n in enumerate(lower) if query in n],
+        ]
+        ranked, seen = [], set()
+        for tier in tiers:
+            if len(ranked) >= limit:
+                break
+            # Ranked by (length, name), ties in list order
+            for i in sorted(set(tier) - seen, key=lambda i: (len(names[i]), lower[i], i)):
+                ranked.append(i)
+                seen.add(i)
+        return [names[i] for i in ranked[:limit]]
+    return run
+
+def test_literal_tiers_match_a_full_scan():
+    rng = random.Random(1)
+    names = list(engine.SOLVENT_NAMES) + [
+        "".join(rng.choice("abcdeth ") for _ in range(rng.randint(3, 20)))
+        + rng.choice(["", " (XY)", " (ab c)"]) for _ in range(500)]
+    index, expected_search = search.SearchIndex(names), naive_search(names)
+    queries = ["", "e", "et", "eth", "a", "ab", "xy", "acet", "b c"]
+    queries += [n[:k] for n in rng.sample(names, 50) for k in (1, 2, 4)]
+    for query in queries:
+        expected = expected_search(query, 20)
+        if expected:
+            assert index.search(query, 20) == expected, query
+
+@pytest.fixture(scope="module")
+def index():
+    return search.SearchIndex(engine.SOLVENT_NAMES)
+
+def test_synonyms_and_typos(index):
+    assert index.search("dcm", 1) == ["Dichloromethane (DCM)"]
+    assert index.search("tolune", 1) == ["Toluene"]
+    assert index.search("Water", 1) == ["Water"]
+
+@pytest.mark.parametrize("limit, status", [("0", 400), ("-1", 400), ("x", 400), ("1000", 200)])
+def test_route_limit_validation(limit, status):
+    import app
+    response = app.app.test_client().get(f"/api/search_solvents?q=e&limit={limit}")
+    assert response.status_code == status
+    if status == 200:
+        assert len(response.get_json()) <= app.MAX_SEARCH_LIMIT
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+import engine
+from spatial import GridIndex
+
+@pytest.fixture(scope="module")
+def grid():
+    return GridIndex(engine.SOLVENT_MATRIX)
+
+def brute_distances(center):
+    return np.linalg.norm(engine.scaled(engine.SOLVENT_MATRIX) - engine.scaled(center), axis=1)
+
+def test_within_matches_brute_force(grid):
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        center = rng.uniform([12, -2, -2], [23, 27, 42])
+        radius = float(rng.uniform(0, 12))
+        idx, dist = grid.within(center, radius)
+        expected = brute_distances(center)
+        assert np.array_equal(np.sort(idx), np.flatnonzero(expected <= radius))
+        assert np.all(np.diff(dist) >= 0)
+
+def test_nearest_matches_brute_force(grid):
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        center = rng.uniform([12, -2, -2], [23, 27, 42])
+        k = int(rng.integers(1, 20))
+        _, dist = grid.nearest(center, k)
+        assert np.allclose(dist, np.sort(brute_distances(center))[:k])
+
+def test_huge_and_infinite_radius_return_everything(grid):
+    center = (18.0, 8.0, 9.0)
+    for radius in (1e300, np.inf):
+        idx, _ = grid.within(center, radius)
+        assert len(idx) == len(grid)
+
+def test_nearest_terminates_for_far_and_non_finite_centers(grid):
+    idx, _ = grid.nearest((1e300, 0.0, 0.0), 2)
+    assert len(idx) == 2
+    idx, _ = grid.nearest((np.nan, 0.0, 0.0), 2)
+    assert len(idx) == 0
+    idx, _ = grid.nearest((18.0, 8.0, 9.0), len(grid) + 5)
+    assert len(idx) == len(grid)
+
+@pytest.mark.parametrize("query", [
+    "/api/nearest_solvents?solute_d=nan&solute_p=0&solute_h=0&solute_ro=1&k=2",
+    "/api/nearest_solvents?solute_d=1e400&solute_p=0&solute_h=0&solute_ro=1&k=2",
+    "/api/solvents_within?solute_d=18&solute_p=8&solute_h=9&solute_ro=inf",
+    "/api/solvents_within?solute_d=18&solute_p=8&solute_h=9&solute_ro=5&red_max=inf",
+])
+def test_routes_reject_non_finite_values(query):
+    import app
+    response = app.app.test_client().get(query)
+    assert response.status_code == 400
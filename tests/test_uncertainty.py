@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import engine
+import uncertainty
+
+SOLUTE = {"d": 18.0, "p": 8.0, "h": 10.0, "ro": 5.0}
+SIGMA = {"d": 0.5, "p": 0.5, "h": 0.5, "ro": 0.0}
+SOLVENT_SIGMA = {"d": 0.5, "p": 0.5, "h": 0.5}
+
+def run(indices, seed=7, samples=2000, sigma=SIGMA, solvent_sigma=SOLVENT_SIGMA):
+    return uncertainty.monte_carlo_red(SOLUTE, indices, sigma, solvent_sigma, samples, seed)
+
+def test_solvent_result_does_not_depend_on_the_rest_of_the_request():
+    acetone, water, toluene = (engine.SOLVENT_INDEX[n] for n in ("Acetone", "Water", "Toluene"))
+    alone = run([acetone])
+    mixed = run([water, toluene, acetone])
+    for key in alone:
+        assert alone[key][0] == mixed[key][2]
+
+def test_seed_changes_the_draws():
+    acetone = engine.SOLVENT_INDEX["Acetone"]
+    assert run([acetone], seed=1)["red_median"][0] != run([acetone], seed=2)["red_median"][0]
+
+def test_zero_sigma_reduces_to_the_deterministic_red():
+    indices = np.arange(0, len(engine.SOLVENT_NAMES), 5)
+    zero = dict.fromkeys("dph", 0.0)
+    result = run(indices, samples=50, sigma={**zero, "ro": 0.0}, solvent_sigma=zero)
+    red = engine.hsp_distance((SOLUTE["d"], SOLUTE["p"], SOLUTE["h"]),
+                              engine.SOLVENT_MATRIX[indices]) / SOLUTE["ro"]
+    assert np.allclose(result["red_median"], red, rtol=1e-5)
+    assert np.array_equal(result["p_soluble"], (red <= 1).astype(float))
+
+def test_interval_brackets_the_median():
+    result = run(np.arange(len(engine.SOLVENT_NAMES)))
+    assert np.all(result["red_low"] <= result["red_median"])
+    assert np.all(result["red_median"] <= result["red_high"])
+    assert np.all((result["p_soluble"] >= 0) & (result["p_soluble"] <= 1))
+
+@pytest.mark.parametrize("options", [{"seed": -1}, {"seed": 1.5}, {"samples": 1.7},
+                                     {"samples": 0}, {"confidence": 1}])
+def test_invalid_settings_are_rejected(options):
+    import app
+    body = {"solute_d": 18, "solute_p": 8, "solute_h": 10, "solute_ro": 5,
+            "solvents": ["Water"], "uncertainty": options}
+    assert app.app.test_client().post("/api/calculate", json=body).status_code == 400